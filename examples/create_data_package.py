@@ -14,6 +14,9 @@ creating data packages with different visualization types. It shows:
 Run this script to see working examples of all major visualization types.
 """
 
+import time
+from functools import lru_cache
+
 import numpy as np
 from myreze.data import MyrezeDataPackage, Time
 from myreze.viz import FlatOverlayRenderer
@@ -23,6 +26,69 @@ from myreze.data.validate import (
     get_visualization_requirements,
 )
 
+# Seed for reproducible output. Each example seeds its own generator, so the
+# examples do not share generator state and can be built in any order or
+# from several threads.
+SEED = 42
+
+
+@lru_cache(maxsize=8)
+def _station_ids(num_stations):
+    """Return the station identifiers, formatted once per station count."""
+    return tuple(f"NYC_STATION_{i:03d}" for i in range(num_stations))
+
+
+def _temperature_grid(rng):
+    """
+    Generate a synthetic 50x50 temperature field for the NYC area.
+
+    Args:
+        rng: NumPy random Generator used for the background noise
+
+    Returns:
+        2D array of temperatures in °C
+    """
+    # Generate synthetic temperature data for NYC area
+    # Temperature varies from 15°C to 35°C across a 50x50 grid
+    temperature_grid = np.empty((50, 50))
+    rng.random(out=temperature_grid)
+    temperature_grid *= 20
+    temperature_grid += 15  # 15-35°C
+
+    # Add some realistic patterns (warmer in center, cooler at edges).
+    # The bump is computed in a single scratch buffer to avoid allocating
+    # a new temporary for every step of the expression.
+    center_y, center_x = 25, 25
+    y, x = np.ogrid[:50, :50]
+    warming = np.hypot(x - center_x, y - center_y)
+    warming *= -1 / 10
+    np.exp(warming, out=warming)
+    warming *= 5
+    temperature_grid += warming
+
+    return temperature_grid
+
+
+def _palette(colors, size=256):
+    """
+    Interpolate hex colors into an RGBA palette.
+
+    Args:
+        colors: Hex color strings from the low to the high end of the scale
+        size: Number of palette entries
+
+    Returns:
+        uint8 array of shape (size, 4)
+    """
+    anchors = np.array([[int(c[i : i + 2], 16) for i in (1, 3, 5)] for c in colors])
+    positions = np.linspace(0, 1, len(colors))
+    steps = np.linspace(0, 1, size)
+
+    palette = np.full((size, 4), 255, dtype=np.uint8)
+    for channel in range(3):
+        palette[:, channel] = np.rint(np.interp(steps, positions, anchors[:, channel]))
+    return palette
+
 
 def create_heatmap_example():
     """
@@ -32,16 +98,9 @@ def create_heatmap_example():
     2D data like temperature, pressure, or elevation fields.
     """
     print("Creating heatmap example...")
+    rng = np.random.default_rng(SEED)
 
-    # Generate synthetic temperature data for NYC area
-    # Temperature varies from 15°C to 35°C across a 50x50 grid
-    temperature_grid = np.random.rand(50, 50) * 20 + 15  # 15-35°C
-
-    # Add some realistic patterns (warmer in center, cooler at edges)
-    center_y, center_x = 25, 25
-    y, x = np.ogrid[:50, :50]
-    distance_from_center = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-    temperature_grid += 5 * np.exp(-distance_from_center / 10)
+    temperature_grid = _temperature_grid(rng)
 
     # Structure data according to heatmap schema
     data = {
@@ -57,7 +116,7 @@ def create_heatmap_example():
         id="nyc-temperature-heatmap",
         data=data,
         time=Time.timestamp("2023-07-15T14:30:00Z"),  # Hot summer afternoon
-        threejs_visualization=ThreeJSRenderer(),
+        threejs_visualization=FlatOverlayRenderer(),
         visualization_type="heatmap",
         metadata={
             "description": "Temperature heatmap for NYC area",
@@ -83,6 +142,61 @@ def create_heatmap_example():
     return package
 
 
+def create_indexed_heatmap_example():
+    """
+    Create a palette-indexed temperature heatmap data package.
+
+    This demonstrates the heatmap_indexed pattern: the grid is quantized
+    to one uint8 palette index per cell, which is much smaller to store
+    and transfer than the float values or a full RGBA texture.
+    """
+    print("\nCreating indexed heatmap example...")
+    rng = np.random.default_rng(SEED)
+    temperature_grid = _temperature_grid(rng)
+
+    # Map the value range linearly onto the 256 palette entries
+    low, high = temperature_grid.min(), temperature_grid.max()
+    scaled = temperature_grid - low
+    scaled *= 255 / (high - low) if high > low else 0
+    indices = np.rint(scaled).astype(np.uint8)
+
+    data = {
+        "indices": indices,
+        "palette": _palette(["#440154", "#31688e", "#35b779", "#fde725"]),
+        "bounds": [-74.1, 40.6, -73.9, 40.9],  # NYC area bounds
+        "values_range": [float(low), float(high)],
+        "units": "celsius",
+    }
+
+    package = MyrezeDataPackage(
+        id="nyc-temperature-heatmap-indexed",
+        data=data,
+        time=Time.timestamp("2023-07-15T14:30:00Z"),
+        threejs_visualization=FlatOverlayRenderer(),
+        visualization_type="heatmap_indexed",
+        metadata={
+            "description": "Palette-indexed temperature heatmap for NYC area",
+            "colormap": "viridis",
+            "parameter": "air_temperature",
+            "data_source": "synthetic_example",
+            "opacity": 0.8,
+        },
+    )
+
+    validation_errors = validate_visualization_data(data, "heatmap_indexed")
+    if validation_errors:
+        print(f"  ❌ Validation errors: {validation_errors}")
+    else:
+        print("  ✅ Data structure valid for indexed heatmap visualization")
+
+    print(
+        f"  🗜️  {indices.nbytes:,} bytes of indices vs "
+        f"{temperature_grid.nbytes:,} bytes of float values"
+    )
+
+    return package
+
+
 def create_point_cloud_example():
     """
     Create a weather stations point cloud data package.
@@ -91,30 +205,33 @@ def create_point_cloud_example():
     at specific geographic locations.
     """
     print("\nCreating point cloud example...")
+    rng = np.random.default_rng(SEED)
 
     # Generate synthetic weather station data
-    np.random.seed(42)  # For reproducible example
     num_stations = 15
 
     # Random locations within NYC area
-    lats = np.random.uniform(40.6, 40.9, num_stations)
-    lons = np.random.uniform(-74.1, -73.9, num_stations)
-    elevations = np.random.uniform(0, 100, num_stations)  # 0-100m elevation
+    lats = rng.uniform(40.6, 40.9, num_stations)
+    lons = rng.uniform(-74.1, -73.9, num_stations)
+    elevations = rng.uniform(0, 100, num_stations)  # 0-100m elevation
 
     # Generate temperature readings (varies with elevation)
     base_temp = 25  # 25°C base temperature
     temperatures = base_temp - (elevations * 0.006)  # Lapse rate effect
-    temperatures += np.random.normal(0, 2, num_stations)  # Measurement noise
+    temperatures += rng.normal(0, 2, num_stations)  # Measurement noise
 
-    # Structure data according to point_cloud schema
+    # Structure data according to point_cloud schema. Locations are stored
+    # as parallel coordinate arrays (one list per axis) rather than one dict
+    # per station, so consumers index them as locations["lat"][i].
     data = {
-        "locations": [
-            {"lat": float(lat), "lon": float(lon), "elevation": float(elev)}
-            for lat, lon, elev in zip(lats, lons, elevations)
-        ],
-        "values": temperatures.tolist(),
-        "point_ids": [f"NYC_STATION_{i:03d}" for i in range(num_stations)],
-        "timestamps": ["2023-07-15T14:30:00Z"] * num_stations,  # All simultaneous
+        "locations": {
+            "lat": lats.tolist(),
+            "lon": lons.tolist(),
+            "elevation": elevations.tolist(),
+        },
+        "values": temperatures,
+        "point_ids": list(_station_ids(num_stations)),
+        "timestamp": "2023-07-15T14:30:00Z",  # Shared by all stations
     }
 
     # Create the data package
@@ -122,7 +239,7 @@ def create_point_cloud_example():
         id="nyc-weather-stations",
         data=data,
         time=Time.timestamp("2023-07-15T14:30:00Z"),
-        threejs_visualization=ThreeJSRenderer(),
+        threejs_visualization=FlatOverlayRenderer(),
         visualization_type="point_cloud",
         metadata={
             "description": "Weather station temperature readings",
@@ -164,29 +281,34 @@ def create_vector_field_example():
 
     # Generate synthetic wind field
     # Create a circular wind pattern (like around a low pressure system)
-    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
     center_lat, center_lon = 40.75, -74.0
 
-    # Calculate distance and angle from center
-    dlat = lat_grid - center_lat
-    dlon = lon_grid - center_lon
-    distance = np.sqrt(dlat**2 + dlon**2)
+    # Calculate offsets from center as a column and a row that broadcast
+    # against each other, so no full coordinate grids are materialized
+    dlat = (lats - center_lat)[:, np.newaxis]
+    dlon = (lons - center_lon)[np.newaxis, :]
+    distance = np.hypot(dlat, dlon)
 
     # Create circular wind pattern
     wind_speed = 15 * np.exp(-distance / 0.1)  # Wind speed decreases with distance
-    wind_angle = np.arctan2(dlat, dlon) + np.pi / 2  # Circular flow
 
-    # Convert to u/v components
-    u_component = wind_speed * np.cos(wind_angle)  # East-west
-    v_component = wind_speed * np.sin(wind_angle)  # North-south
-    magnitude = np.sqrt(u_component**2 + v_component**2)
+    # Convert to u/v components. Circular flow is the radial direction
+    # rotated by 90 degrees, i.e. (-dlat, dlon) / distance, so no
+    # trigonometry is needed and the magnitude is the wind speed itself.
+    inv_distance = np.divide(
+        1.0, distance, out=np.zeros_like(distance), where=distance > 0
+    )
+    # The components are packed into one float32 array ordered u, v,
+    # magnitude, so each stays contiguous in a single buffer.
+    field = np.empty((3, len(lats), len(lons)), dtype=np.float32)
+    np.multiply(-wind_speed * dlat, inv_distance, out=field[0])  # East-west
+    np.multiply(wind_speed * dlon, inv_distance, out=field[1])  # North-south
+    field[2] = wind_speed
 
     # Structure data according to vector_field schema
     data = {
         "grid_points": {"lats": lats.tolist(), "lons": lons.tolist()},
-        "u_component": u_component.tolist(),
-        "v_component": v_component.tolist(),
-        "magnitude": magnitude.tolist(),
+        "field": field,
         "units": "m/s",
     }
 
@@ -195,7 +317,7 @@ def create_vector_field_example():
         id="nyc-wind-field",
         data=data,
         time=Time.timestamp("2023-07-15T14:30:00Z"),
-        threejs_visualization=ThreeJSRenderer(),
+        threejs_visualization=FlatOverlayRenderer(),
         visualization_type="vector_field",
         metadata={
             "description": "Wind field over NYC area",
@@ -213,12 +335,37 @@ def create_vector_field_example():
     else:
         print("  ✅ Data structure valid for vector field visualization")
 
-    print(f"  💨 Wind speed range: {magnitude.min():.1f} to {magnitude.max():.1f} m/s")
+    print(f"  💨 Wind speed range: {field[2].min():.1f} to {field[2].max():.1f} m/s")
     print(f"  🎯 Grid size: {len(lats)} x {len(lons)} points")
 
     return package
 
 
+def _generate_track(hours, start_lat, start_lon, rng):
+    """
+    Generate a synthetic hurricane track moving northeast.
+
+    Args:
+        hours: Array of hour offsets from the start of the track
+        start_lat: Starting latitude in degrees
+        start_lon: Starting longitude in degrees
+        rng: NumPy random Generator used for the track noise
+
+    Returns:
+        Tuple of (lats, lons, intensities) arrays, one entry per hour
+    """
+    num_points = len(hours)
+
+    # Move northeast with some randomness
+    lats = start_lat + (hours / 24) * 1.5 + rng.normal(0, 0.2, num_points)
+    lons = start_lon + (hours / 24) * 2.0 + rng.normal(0, 0.3, num_points)
+
+    # Storm intensifies for two days, then weakens
+    intensities = np.where(hours < 48, 80 + hours * 0.5, 104 - (hours - 48) * 0.8)
+
+    return lats, lons, intensities
+
+
 def create_trajectory_example():
     """
     Create a storm track trajectory data package.
@@ -228,43 +375,37 @@ def create_trajectory_example():
     """
     print("\nCreating trajectory example...")
 
-    # Generate synthetic hurricane track moving northeast
-    start_lat, start_lon = 25.0, -80.0  # Start near Florida
-
-    # Track points over 4 days (6-hour intervals)
-    times = []
-    positions = []
-    intensities = []
-
-    for hour in range(0, 96, 6):  # Every 6 hours for 4 days
-        # Move northeast with some randomness
-        lat = start_lat + (hour / 24) * 1.5 + np.random.normal(0, 0.2)
-        lon = start_lon + (hour / 24) * 2.0 + np.random.normal(0, 0.3)
-
-        # Storm intensifies then weakens
-        if hour < 48:
-            intensity = 80 + hour * 0.5  # Strengthening
-        else:
-            intensity = 104 - (hour - 48) * 0.8  # Weakening
-
-        time_str = f"2023-08-20T{hour:02d}:00:00Z"
-        times.append(time_str)
-        positions.append(
-            {
-                "lat": float(lat),
-                "lon": float(lon),
-                "pressure": int(1013 - intensity),  # Lower pressure = stronger storm
-                "timestamp": time_str,
-            }
+    # Track points over 4 days (6-hour intervals), starting near Florida
+    hours = np.arange(0, 96, 6)
+    num_points = len(hours)
+    rng = np.random.default_rng(SEED)
+    lats, lons, intensities = _generate_track(hours, 25.0, -80.0, rng)
+
+    start_time = np.datetime64("2023-08-20T00:00:00")
+    times = [
+        f"{t}Z"
+        for t in np.datetime_as_string(
+            start_time + hours.astype("timedelta64[h]"), unit="s"
         )
-        intensities.append(float(intensity))
+    ]
+
+    # Track points stored as parallel arrays, one per attribute
+    positions = {
+        "lat": lats.tolist(),
+        "lon": lons.tolist(),
+        "pressure": (1013 - intensities).astype(np.int32).tolist(),
+        "timestamp": times,
+    }
+    # Category 2 between 96 and 111 kt, category 1 otherwise
+    storm_category = np.where((intensities >= 96) & (intensities < 111), 2, 1)
+    intensities = intensities.tolist()
 
     # Structure data for trajectory visualization
     data = {
         "positions": positions,
         "intensities": intensities,
         "track_id": "EXAMPLE_2023",
-        "storm_category": [1 if i < 96 else 2 if i < 111 else 1 for i in intensities],
+        "storm_category": storm_category.tolist(),
     }
 
     # Create the data package
@@ -272,7 +413,7 @@ def create_trajectory_example():
         id="hurricane-example-track",
         data=data,
         time=Time.series(times),
-        threejs_visualization=ThreeJSRenderer(),
+        threejs_visualization=FlatOverlayRenderer(),
         visualization_type="trajectory",
         metadata={
             "description": "Hurricane Example track forecast",
@@ -284,7 +425,7 @@ def create_trajectory_example():
         },
     )
 
-    print(f"  ✅ Created trajectory with {len(positions)} positions")
+    print(f"  ✅ Created trajectory with {num_points} positions")
     print(f"  🌀 Peak intensity: {max(intensities):.0f} kt")
     print(f"  📅 Duration: {len(times)} time points over 4 days")
 
@@ -318,7 +459,7 @@ def demonstrate_discovery_features():
 
     test_data_cases = [
         {"grid": [[1, 2], [3, 4]], "bounds": [-74, 40, -73, 41]},
-        {"locations": [{"lat": 40.7, "lon": -74.0}], "values": [25.0]},
+        {"locations": {"lat": [40.7], "lon": [-74.0]}, "values": [25.0]},
         {"grid_points": {"lats": [], "lons": []}, "u_component": [], "v_component": []},
     ]
 
@@ -339,6 +480,7 @@ def main():
         # Create examples of different visualization types
         examples = []
         examples.append(create_heatmap_example())
+        examples.append(create_indexed_heatmap_example())
         examples.append(create_point_cloud_example())
         examples.append(create_vector_field_example())
         examples.append(create_trajectory_example())
@@ -361,6 +503,16 @@ def main():
             # Demonstrate deserialization
             restored_package = MyrezeDataPackage.from_json(json_str)
             print(f"  ✅ Successfully restored from JSON")
+
+            # Compare with pickle, which keeps arrays intact for in-process
+            # or Python-to-Python hand-offs
+            start = time.perf_counter()
+            MyrezeDataPackage.from_json(package.to_json())
+            json_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            MyrezeDataPackage.from_pickle(package.to_pickle())
+            pickle_ms = (time.perf_counter() - start) * 1000
+            print(f"  ⏱️  Round trip: JSON {json_ms:.2f} ms, pickle {pickle_ms:.2f} ms")
             print(f"  🏷️  Visualization type: {restored_package.visualization_type}")
 
             # Show metadata
@@ -9,14 +9,47 @@ from myreze.viz.threejs.png_renderer import PNGTexture
 import numpy as np
 from typing import Dict, Any, Optional, List
 import uuid
-import requests
-import io
-from PIL import Image
+import asyncio
+
+
+def decode_rgba_texture(body: bytes) -> np.ndarray:
+    """Decode PNG bytes to a read-only RGBA array."""
+    # Imported lazily: only the PNG product needs PIL
+    import io
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(body))
+
+    # Ensure RGBA format for transparency
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    texture_array = np.asarray(image, dtype=np.uint8)
+    # Shared between packages, so guard against in-place edits
+    texture_array.setflags(write=False)
+    return texture_array
 
 
 class WeatherProduct(Product):
     """A product for weather data."""
 
+    # Mock textures come from a pool generated once, so an order is an
+    # index into the pool instead of a fresh allocation and RNG fill
+    TEXTURE_POOL_SIZE = 64
+    _texture_pool: Optional[np.ndarray] = None
+    _rng = np.random.default_rng()
+
+    @classmethod
+    def _mock_texture(cls) -> np.ndarray:
+        """Return a read-only random texture view from the shared pool."""
+        if cls._texture_pool is None:
+            pool = cls._rng.integers(
+                0, 255, (cls.TEXTURE_POOL_SIZE, 100, 100, 4), dtype=np.uint8
+            )
+            pool.setflags(write=False)
+            cls._texture_pool = pool
+        return cls._texture_pool[cls._rng.integers(cls.TEXTURE_POOL_SIZE)]
+
     async def generate_package(
         self,
         spatial_region: Dict[str, Any],
@@ -25,7 +58,7 @@ class WeatherProduct(Product):
     ) -> MyrezeDataPackage:
         # Mock data fetching (replace with real source, e.g., ECMWF)
         data = {
-            "texture": np.random.randint(0, 255, (100, 100, 4), dtype=np.uint8),
+            "texture": self._mock_texture(),
         }
         return MyrezeDataPackage(
             id=f"pkg-{uuid.uuid4()}",
@@ -39,6 +72,11 @@ class WeatherProduct(Product):
 class TransparentPNGProduct(Product):
     """A product that returns a hardcoded transparent PNG from URL."""
 
+    # Shared across orders: one decoded texture per URL, and one lock per
+    # URL so concurrent orders wait on a single download
+    _textures: Dict[str, np.ndarray] = {}
+    _fetch_locks: Dict[str, asyncio.Lock] = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Use a reliable transparent PNG from a public CDN
@@ -48,6 +86,33 @@ class TransparentPNGProduct(Product):
         # self.png_url = "https://upload.wikimedia.org/wikipedia/commons/thumb/8/89/HD_transparent_picture.png/64px-HD_transparent_picture.png"  # noqa
         # self.png_url = "https://dummyimage.com/400x300/000000/ffffff.png&text=Transparent+Test"  # noqa
 
+    @classmethod
+    async def fetch_texture(cls, url: str) -> np.ndarray:
+        """Fetch and decode a PNG once, without blocking the event loop."""
+        texture = cls._textures.get(url)
+        if texture is not None:
+            return texture
+
+        async with cls._fetch_locks.setdefault(url, asyncio.Lock()):
+            # Another order may have completed the download while we waited
+            texture = cls._textures.get(url)
+            if texture is None:
+                # Imported lazily: only the PNG product needs an HTTP client
+                import aiohttp
+
+                # Each URL is downloaded once, so a short-lived session is
+                # enough and is closed as soon as the body has been read
+                async with aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as session:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        body = await response.read()
+                texture = decode_rgba_texture(body)
+                cls._textures[url] = texture
+
+        return texture
+
     async def generate_package(
         self,
         spatial_region: Dict[str, Any],
@@ -56,18 +121,7 @@ class TransparentPNGProduct(Product):
     ) -> MyrezeDataPackage:
         # Fetch the PNG from the URL
         try:
-            response = requests.get(self.png_url, timeout=10)
-            response.raise_for_status()
-
-            # Convert to PIL Image then to numpy array
-            image = Image.open(io.BytesIO(response.content))
-
-            # Ensure RGBA format for transparency
-            if image.mode != "RGBA":
-                image = image.convert("RGBA")
-
-            # Convert to numpy array
-            texture_array = np.array(image)
+            texture_array = await self.fetch_texture(self.png_url)
 
             # Create data package with the fetched PNG
             data = {
@@ -138,9 +192,9 @@ class FlexibleProductProvider(ProductProvider):
     A provider that offers multiple products
     """
 
-    async def get_products(self) -> List[Product]:
-        """Return a list of available products with their capabilities."""
-        return [
+    def __init__(self):
+        # The catalogue is static, so build it once instead of per request
+        self._products = [
             WeatherProduct(
                 product_id="15-day-clouds",
                 name="15 Day global cloud forecast",
@@ -226,11 +280,15 @@ class FlexibleProductProvider(ProductProvider):
             ),
         ]
 
+    async def get_products(self) -> List[Product]:
+        """Return a list of available products with their capabilities."""
+        return self._products
+
 
 # Run the store
 if __name__ == "__main__":
     provider = FlexibleProductProvider()
-    server = StoreServer(provider)
+    server = StoreServer(provider, cache_products=True)  # Static catalogue
     server.run()
 
 
@@ -274,4 +332,8 @@ curl -X POST http://localhost:8000/orders \\
       "value": "2023-01-01T12:00:00Z"
     }
   }'
+
+4. To receive an order as msgpack instead of JSON (requires msgpack on the
+server; decode with MyrezeDataPackage.from_msgpack), add the header:
+  -H "Accept: application/msgpack" --output package.msgpack
 """
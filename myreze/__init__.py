@@ -88,7 +88,7 @@ data = {
 **Point Cloud:**
 ```python
 data = {
-    "locations": [{"lat": 40.7, "lon": -74.0, "elevation": 10}, ...],
+    "locations": {"lat": [40.7, ...], "lon": [-74.0, ...], "elevation": [10, ...]},
     "values": [25.3, 24.1, 26.2],  # Measurements at each location
     "point_ids": ["sensor_001", "sensor_002", ...]
 }
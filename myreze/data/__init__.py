@@ -5,10 +5,12 @@ from myreze.data.core import (
     VisualSummary,
     SemanticContext,
     MultiResolutionData,
+    QuantizedArray,
     VISUALIZATION_TYPES,
     TIME_TYPES,
     VISUALIZATION_SCHEMAS,
     SEMANTIC_CATEGORIES,
+    match_semantic_categories,
 )
 from myreze.data.validate import validate_mdp
 
@@ -31,6 +33,7 @@ __all__ = [
     "VisualSummary",
     "SemanticContext",
     "MultiResolutionData",
+    "QuantizedArray",
     # Multi-agent context
     "AgentAnnotation",
     "AgentContextChain",
@@ -42,4 +45,5 @@ __all__ = [
     "TIME_TYPES",
     "VISUALIZATION_SCHEMAS",
     "SEMANTIC_CATEGORIES",
+    "match_semantic_categories",
 ]
@@ -11,6 +11,19 @@ from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 import uuid
 
+# Keyword arguments accepted by MyrezeDataPackage.add_agent_context
+_CONTEXT_KEYS = frozenset(
+    {
+        "content",
+        "agent_id",
+        "context_type",
+        "agent_type",
+        "annotation_type",
+        "confidence",
+        "metadata",
+    }
+)
+
 
 class AgentAnnotation:
     """
@@ -124,6 +137,7 @@ class AgentContextChain:
         confidence: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
         references: Optional[List[str]] = None,
+        timestamp: Optional[str] = None,
     ) -> AgentAnnotation:
         """
         Add a new annotation to the chain.
@@ -136,22 +150,25 @@ class AgentContextChain:
             confidence: Confidence score
             metadata: Additional metadata
             references: References to other annotations or sources
+            timestamp: ISO 8601 creation time, defaults to now
 
         Returns:
             The created AgentAnnotation
         """
+        timestamp = timestamp or datetime.now().isoformat()
         annotation = AgentAnnotation(
             content=content,
             agent_id=agent_id,
             agent_type=agent_type,
             annotation_type=annotation_type,
             confidence=confidence,
+            timestamp=timestamp,
             metadata=metadata,
             references=references,
         )
 
         self.annotations.append(annotation)
-        self.last_modified = datetime.now().isoformat()
+        self.last_modified = timestamp
 
         return annotation
 
@@ -179,32 +196,44 @@ class AgentContextChain:
         if not self.annotations:
             return {}
 
-        # Group by annotation type
+        # Aggregate per annotation type in a single pass over the chain
         by_type = {}
+        agents = set()
         for ann in self.annotations:
-            if ann.annotation_type not in by_type:
-                by_type[ann.annotation_type] = []
-            by_type[ann.annotation_type].append(ann)
+            agents.add(ann.agent_id)
+            stats = by_type.get(ann.annotation_type)
+            if stats is None:
+                stats = by_type[ann.annotation_type] = {
+                    "count": 0,
+                    "agents": [],
+                    "confidence_sum": 0.0,
+                    "confidence_count": 0,
+                }
+            stats["count"] += 1
+            stats["agents"].append(ann.agent_id)
+            if ann.confidence:
+                stats["confidence_sum"] += ann.confidence
+                stats["confidence_count"] += 1
+            stats["latest_content"] = ann.content
 
         # Calculate consensus metrics
         consensus = {
             "total_annotations": len(self.annotations),
-            "unique_agents": len(set(ann.agent_id for ann in self.annotations)),
+            "unique_agents": len(agents),
             "annotation_types": list(by_type.keys()),
             "by_type": {},
         }
 
-        for ann_type, annotations in by_type.items():
+        for ann_type, stats in by_type.items():
             consensus["by_type"][ann_type] = {
-                "count": len(annotations),
-                "agents": [ann.agent_id for ann in annotations],
+                "count": stats["count"],
+                "agents": stats["agents"],
                 "avg_confidence": (
-                    sum(ann.confidence for ann in annotations if ann.confidence)
-                    / len([ann for ann in annotations if ann.confidence])
-                    if any(ann.confidence for ann in annotations)
+                    stats["confidence_sum"] / stats["confidence_count"]
+                    if stats["confidence_count"]
                     else None
                 ),
-                "latest_content": annotations[-1].content,
+                "latest_content": stats["latest_content"],
             }
 
         return consensus
@@ -292,13 +321,7 @@ class MultiAgentContext:
         Returns:
             The created AgentAnnotation
         """
-        # Create chain if it doesn't exist
-        if context_type not in self.context_chains:
-            self.context_chains[context_type] = AgentContextChain(
-                context_type=context_type
-            )
-
-        annotation = self.context_chains[context_type].add_annotation(
+        annotation = self._get_chain(context_type).add_annotation(
             content=content,
             agent_id=agent_id,
             agent_type=agent_type,
@@ -311,6 +334,47 @@ class MultiAgentContext:
         self.last_modified = datetime.now().isoformat()
         return annotation
 
+    def _get_chain(self, context_type: str) -> AgentContextChain:
+        """Return the chain for a context type, creating it if needed."""
+        chain = self.context_chains.get(context_type)
+        if chain is None:
+            chain = self.context_chains[context_type] = AgentContextChain(
+                context_type=context_type
+            )
+        return chain
+
+    def add_contexts(self, contexts: List[Dict[str, Any]]) -> List[AgentAnnotation]:
+        """
+        Add several contexts at once.
+
+        All annotations in the batch share one timestamp, and this context
+        is marked modified once rather than per item.
+
+        Args:
+            contexts: Keyword arguments for ``add_agent_context``, one dict
+                per annotation. ``context_type`` defaults to "analysis".
+
+        Returns:
+            The created AgentAnnotations, in order
+
+        Raises:
+            TypeError: If a dict has keys ``add_agent_context`` does not take
+        """
+        for context in contexts:
+            unknown = set(context) - _CONTEXT_KEYS
+            if unknown:
+                raise TypeError(f"Unexpected context keys: {sorted(unknown)}")
+
+        now = datetime.now().isoformat()
+        annotations = []
+        for context in contexts:
+            kwargs = dict(context)
+            chain = self._get_chain(kwargs.pop("context_type", "analysis"))
+            annotations.append(chain.add_annotation(timestamp=now, **kwargs))
+
+        self.last_modified = now
+        return annotations
+
     def get_expert_opinions(self) -> List[AgentAnnotation]:
         """Get all expert opinions across all chains."""
         opinions = []
@@ -1,16 +1,28 @@
-from typing import Dict, Any, Optional, Union, List, Literal
+from typing import Dict, Any, Optional, Union, List, Literal, Tuple
 import json
 import numpy as np
 from myreze.viz.threejs.threejs import ThreeJSRenderer
 from myreze.viz.unreal.unreal import UnrealRenderer
-from myreze.data.validate import validate_mdp
-import isodate  # For ISO 8601 parsing
+from myreze.data.validate import validate_mdp, _check_time_value
 import base64
 import hashlib
 from datetime import datetime
 import io
+import math
+import pickle
+import sys
 import warnings
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding with native NumPy support
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: binary encoding for array-heavy packages
+    msgpack = None
+
 # Forward declaration to avoid circular imports
 MultiAgentContext = None
 
@@ -19,6 +31,7 @@ VISUALIZATION_TYPES = [
     "flat_overlay",
     "point_cloud",
     "heatmap",
+    "heatmap_indexed",
     "vector_field",
     "terrain",
     "trajectory",
@@ -49,6 +62,40 @@ SEMANTIC_CATEGORIES = [
     "economic",
 ]
 
+
+def _build_category_index(categories: List[str]) -> Dict[str, List[str]]:
+    """Map every substring of each category to the categories containing it."""
+    index: Dict[str, List[str]] = {}
+    for category in categories:
+        for start in range(len(category)):
+            for end in range(start + 1, len(category) + 1):
+                matches = index.setdefault(category[start:end], [])
+                if category not in matches:
+                    matches.append(category)
+    return index
+
+
+# Built once so tags are matched against categories with a dict lookup
+_CATEGORY_INDEX = _build_category_index(SEMANTIC_CATEGORIES)
+
+
+def match_semantic_categories(tags: List[str]) -> List[str]:
+    """
+    Find the semantic categories that contain any of the given tags.
+
+    A category matches when a tag is a substring of it, e.g. "urban" or
+    "ocean" ("oceanic").
+
+    Args:
+        tags: Semantic tags, e.g. ``SemanticContext.semantic_tags``
+
+    Returns:
+        Matching categories in ``SEMANTIC_CATEGORIES`` order
+    """
+    matches = {category for tag in tags for category in _CATEGORY_INDEX.get(tag, ())}
+    return [category for category in SEMANTIC_CATEGORIES if category in matches]
+
+
 # Data structure schemas for each visualization type
 VISUALIZATION_SCHEMAS = {
     "flat_overlay": {
@@ -60,8 +107,8 @@ VISUALIZATION_SCHEMAS = {
     },
     "point_cloud": {
         "required_fields": ["locations", "values"],
-        "optional_fields": ["point_ids", "colors", "sizes"],
-        "locations_format": "[{lat: float, lon: float, elevation?: float}, ...]",
+        "optional_fields": ["point_ids", "colors", "sizes", "timestamps", "timestamp"],
+        "locations_format": "{lat: [...], lon: [...], elevation?: [...]}",
         "values_format": "List of measurement values at each location",
         "description": "Discrete data points like sensor readings, weather stations",
     },
@@ -72,16 +119,200 @@ VISUALIZATION_SCHEMAS = {
         "bounds_format": "[west, south, east, north] in degrees",
         "description": "Continuous surfaces like temperature, pressure fields",
     },
+    "heatmap_indexed": {
+        "required_fields": ["indices", "palette", "bounds"],
+        "optional_fields": ["values_range", "opacity"],
+        "indices_format": "2D uint8 array of palette indices",
+        "palette_format": "Up to 256 RGBA rows of uint8, array[n][4]",
+        "bounds_format": "[west, south, east, north] in degrees",
+        "description": "Heatmap quantized to a color palette for compact transfer",
+    },
     "vector_field": {
         "required_fields": ["grid_points", "u_component", "v_component"],
-        "optional_fields": ["magnitude", "arrow_scale", "color_by"],
+        "optional_fields": ["magnitude", "arrow_scale", "color_by", "field"],
         "grid_points_format": "{lats: [...], lons: [...]}",
         "components_format": "2D arrays for east-west (u) and north-south (v)",
+        "field_format": "float32 array[3][height][width] of u, v, magnitude",
         "description": "Directional data like wind, ocean currents",
     },
 }
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize objects the JSON encoder does not handle natively."""
+    if isinstance(obj, np.ndarray):
+        # Non-contiguous arrays and unsupported dtypes are rejected by the
+        # native NumPy path, so encode them as nested lists instead
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Separators used by _json_dumps, so output has the same layout whichever
+# encoder handles it
+_JSON_SEPARATORS = (",", ":") if orjson is not None else (", ", ": ")
+_JSON_ITEM_SEPARATOR = _JSON_SEPARATORS[0]
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return whether ``obj`` contains a NaN or infinite float anywhere."""
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            return not np.isfinite(obj).all()
+        if obj.dtype.kind == "O":
+            return any(_has_non_finite(value) for value in obj.flat)
+        return False
+    if isinstance(obj, (float, np.floating)):
+        return not math.isfinite(obj)
+    return False
+
+
+def _json_dumps(obj: Any, fast: Optional[bool] = None) -> str:
+    """
+    Serialize with ``orjson`` when it is installed, else the stdlib.
+
+    ``orjson`` writes NaN and infinity as ``null``, which would lose
+    missing-value markers in data grids, so objects containing non-finite
+    floats always go through the stdlib encoder and are written as
+    ``NaN``/``Infinity`` tokens.
+
+    Args:
+        obj: Object to serialize
+        fast: Whether ``orjson`` may be used; checked against ``obj`` when
+            not given
+
+    Returns:
+        JSON string
+    """
+    if fast is None:
+        fast = orjson is not None and not _has_non_finite(obj)
+    if fast:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(obj, default=_json_default, separators=_JSON_SEPARATORS)
+
+
+def _json_loads(json_str: str) -> Any:
+    """
+    Parse JSON with ``orjson`` when it is installed, else the stdlib.
+
+    ``orjson`` rejects the ``NaN``/``Infinity`` tokens the stdlib writes for
+    non-finite floats, so input it cannot parse is retried with the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode NumPy values for msgpack, keeping arrays as one binary blob."""
+    if isinstance(obj, np.ndarray):
+        return {
+            "__nd__": True,
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "data": np.ascontiguousarray(obj).tobytes(),
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+def _msgpack_object_hook(obj: Dict[str, Any]) -> Any:
+    """Decode arrays encoded by ``_msgpack_default``."""
+    if obj.get("__nd__"):
+        array = np.frombuffer(obj["data"], dtype=np.dtype(obj["dtype"]))
+        return array.reshape(obj["shape"])
+    return obj
+
+
+_BASE62_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _to_base62(number: int) -> str:
+    """Encode a non-negative integer as a base62 string."""
+    digits = ""
+    while True:
+        number, remainder = divmod(number, 62)
+        digits = _BASE62_DIGITS[remainder] + digits
+        if not number:
+            return digits
+
+
+def _from_base62(digits: str) -> int:
+    """Decode a string produced by ``_to_base62``."""
+    number = 0
+    for digit in digits:
+        number = number * 62 + _BASE62_DIGITS.index(digit)
+    return number
+
+
+def _count_strings(value: Any, counts: Dict[str, int]) -> None:
+    """Count occurrences of each string key and value in a JSON-like tree."""
+    if isinstance(value, str):
+        counts[value] = counts.get(value, 0) + 1
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] = counts.get(key, 0) + 1
+            _count_strings(item, counts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _count_strings(item, counts)
+
+
+def _dedupe_strings(value: Any, refs: Dict[str, str]) -> Any:
+    """
+    Replace repeated string keys and values in a JSON-like tree by references.
+
+    ``refs`` maps each repeated string to its ``"|<base62 index>"``
+    reference. Other strings are kept inline, with a leading ``|`` doubled
+    so they cannot be mistaken for references. Non-string scalars are left
+    in place.
+    """
+    if isinstance(value, str):
+        ref = refs.get(value)
+        if ref is not None:
+            return ref
+        return "|" + value if value.startswith("|") else value
+    if isinstance(value, dict):
+        return {
+            _dedupe_strings(key, refs): _dedupe_strings(item, refs)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_dedupe_strings(item, refs) for item in value]
+    return value
+
+
+def _restore_strings(value: Any, table: List[str]) -> Any:
+    """Reverse ``_dedupe_strings`` using its string table."""
+    if isinstance(value, str):
+        if value.startswith("||"):
+            return value[1:]
+        if value.startswith("|"):
+            return table[_from_base62(value[1:])]
+        return value
+    if isinstance(value, dict):
+        return {
+            _restore_strings(key, table): _restore_strings(item, table)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_restore_strings(item, table) for item in value]
+    return value
+
+
 class VisualSummary:
     """
     Container for visual representations that multimodal LLMs can interpret.
@@ -144,6 +375,16 @@ class VisualSummary:
         )
 
 
+def _intern_terms(terms: Optional[List[str]]) -> List[str]:
+    """
+    Intern tags or keywords and drop duplicates, keeping their order.
+
+    The same short tags recur across every package in a corpus, so
+    interning lets them share one string object each.
+    """
+    return list(dict.fromkeys(sys.intern(term) for term in terms or ()))
+
+
 class SemanticContext:
     """
     Semantic metadata for MCP/RAG integration and LLM interpretation.
@@ -175,12 +416,12 @@ class SemanticContext:
             search_keywords: Keywords for search and retrieval
         """
         self.natural_description = natural_description
-        self.semantic_tags = semantic_tags or []
+        self.semantic_tags = _intern_terms(semantic_tags)
         self.geographic_context = geographic_context or {}
         self.temporal_context = temporal_context or {}
         self.data_insights = data_insights or {}
         self.relationships = relationships or []
-        self.search_keywords = search_keywords or []
+        self.search_keywords = _intern_terms(search_keywords)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dictionary."""
@@ -208,12 +449,131 @@ class SemanticContext:
         )
 
 
+class QuantizedArray:
+    """
+    Integer-quantized grid for overview and visualization variants.
+
+    Values are stored as ``round((array - offset) / scale)`` in a small
+    integer dtype and restored with ``values * scale + offset``. A 0-1
+    normalized grid fits ``uint8`` with ``scale=1/255``; temperatures fit
+    ``int16`` with ``scale=0.1``.
+
+    Example:
+        >>> overview = QuantizedArray.from_array(grid[::4, ::4], np.int16, 0.1)
+        >>> overview.dequantize()  # float32 grid, 0.1 degree precision
+    """
+
+    def __init__(self, values: np.ndarray, scale: float, offset: float = 0.0):
+        self.values = np.asarray(values)
+        self.scale = float(scale)
+        self.offset = float(offset)
+
+    @classmethod
+    def from_array(
+        cls, array: Any, dtype: Any, scale: float, offset: float = 0.0
+    ) -> "QuantizedArray":
+        """
+        Quantize a floating point array.
+
+        Args:
+            array: Values to quantize
+            dtype: Integer dtype to store, e.g. ``np.uint8`` or ``np.int16``
+            scale: Size of one quantization step
+            offset: Value represented by zero
+
+        Returns:
+            QuantizedArray with values clipped to the range of ``dtype``
+        """
+        info = np.iinfo(dtype)
+        # One float64 scratch buffer is reused for every step
+        steps = np.subtract(array, offset, dtype=np.float64)
+        steps /= scale
+        np.rint(steps, out=steps)
+        np.clip(steps, info.min, info.max, out=steps)
+        return cls(steps.astype(dtype), scale, offset)
+
+    def dequantize(self) -> np.ndarray:
+        """Return the approximate original values as a float32 array."""
+        return self.values * np.float32(self.scale) + np.float32(self.offset)
+
+
+def _narrow_floats(value: Any) -> Any:
+    """Return float arrays wider than 32 bits as float32, other values as is."""
+    if (
+        isinstance(value, np.ndarray)
+        and value.dtype.kind == "f"
+        and value.dtype.itemsize > 4
+    ):
+        return value.astype(np.float32)
+    return value
+
+
+def _encode_arrays(value: Any) -> Any:
+    """
+    Encode NumPy arrays nested in dicts as compact base64 records.
+
+    Wider floating point arrays are stored as float32, which halves their
+    size and is ample precision for visualization and analysis grids;
+    float16 arrays are kept as they are. ``QuantizedArray`` values keep
+    their integer dtype and add ``scale`` and ``offset`` to the record.
+    """
+    if isinstance(value, QuantizedArray):
+        record = _encode_arrays(value.values)
+        record["scale"] = value.scale
+        record["offset"] = value.offset
+        return record
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(_narrow_floats(value))
+        return {
+            "__ndarray__": base64.b64encode(value.tobytes()).decode("ascii"),
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+        }
+    if isinstance(value, dict):
+        return {key: _encode_arrays(item) for key, item in value.items()}
+    return value
+
+
+def _decode_arrays(value: Any) -> Any:
+    """
+    Decode records written by ``_encode_arrays`` back into NumPy arrays.
+
+    Quantized records come back as ``QuantizedArray`` so callers only pay
+    for dequantization when they need the float values.
+    """
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            array = np.frombuffer(
+                base64.b64decode(value["__ndarray__"]), dtype=np.dtype(value["dtype"])
+            ).reshape(value["shape"])
+            if "scale" in value:
+                return QuantizedArray(array, value["scale"], value.get("offset", 0.0))
+            return array
+        return {key: _decode_arrays(item) for key, item in value.items()}
+    return value
+
+
 class MultiResolutionData:
     """
     Multi-resolution data support for different processing needs.
 
     Provides data at different levels of detail to support various
-    use cases from quick overview to detailed analysis.
+    use cases from quick overview to detailed analysis. Grids may be
+    given as NumPy arrays; they are serialized as base64-encoded float32
+    buffers rather than nested lists, and restored as arrays by
+    ``from_dict``.
+
+    Values inside ``processed_variants`` may also be zero-argument
+    callables, which are only evaluated when the variant is requested
+    through ``get_variant`` or serialized via ``include_variants``.
+
+    Example:
+        >>> multi_resolution = MultiResolutionData(
+        ...     processed_variants={
+        ...         "anomaly": {"grid": lambda: grid - grid.mean()},
+        ...     }
+        ... )
+        >>> anomaly = multi_resolution.get_variant("anomaly")["grid"]
     """
 
     def __init__(
@@ -240,14 +600,60 @@ class MultiResolutionData:
         self.full_resolution = full_resolution or {}
         self.processed_variants = processed_variants or {}
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to JSON-serializable dictionary."""
+    def get_variant(self, name: str) -> Dict[str, Any]:
+        """
+        Get a processed variant, evaluating any lazy values it holds.
+
+        Evaluated values replace their callables, so each is computed once.
+
+        Args:
+            name: Variant name, e.g. "normalized"
+
+        Returns:
+            The variant dictionary with all values materialized
+        """
+        variant = self.processed_variants[name]
+        for key, value in variant.items():
+            if callable(value):
+                variant[key] = value()
+        return variant
+
+    def _evaluated_variants(self) -> Dict[str, Dict[str, Any]]:
+        """Return the processed variants without unevaluated lazy values."""
+        return {
+            name: {key: value for key, value in variant.items() if not callable(value)}
+            for name, variant in self.processed_variants.items()
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle like to_dict: lazy values that were never evaluated are
+        # left out, since closures and lambdas cannot be pickled
+        state = self.__dict__.copy()
+        state["processed_variants"] = self._evaluated_variants()
+        return state
+
+    def to_dict(self, include_variants: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Convert to JSON-serializable dictionary.
+
+        Args:
+            include_variants: Names of variants whose lazy values should be
+                evaluated and serialized. Lazy values of other variants are
+                left out; already evaluated values are always included.
+
+        Returns:
+            Dictionary representation of the multi-resolution data
+        """
+        for name in include_variants or ():
+            self.get_variant(name)
+
+        processed_variants = self._evaluated_variants()
         return {
             "overview": self.overview,
             "summary_stats": self.summary_stats,
-            "reduced_resolution": self.reduced_resolution,
-            "full_resolution": self.full_resolution,
-            "processed_variants": self.processed_variants,
+            "reduced_resolution": _encode_arrays(self.reduced_resolution),
+            "full_resolution": _encode_arrays(self.full_resolution),
+            "processed_variants": _encode_arrays(processed_variants),
         }
 
     @classmethod
@@ -256,9 +662,9 @@ class MultiResolutionData:
         return cls(
             overview=data.get("overview", {}),
             summary_stats=data.get("summary_stats", {}),
-            reduced_resolution=data.get("reduced_resolution", {}),
-            full_resolution=data.get("full_resolution", {}),
-            processed_variants=data.get("processed_variants", {}),
+            reduced_resolution=_decode_arrays(data.get("reduced_resolution", {})),
+            full_resolution=_decode_arrays(data.get("full_resolution", {})),
+            processed_variants=_decode_arrays(data.get("processed_variants", {})),
         )
 
 
@@ -385,31 +791,7 @@ class Time:
                 f"Invalid time type: {self.type}. Must be one of {TIME_TYPES}"
             )
 
-        if self.type == "Timestamp":
-            if not isinstance(self.value, str):
-                raise ValueError("Timestamp value must be a string")
-            isodate.parse_datetime(self.value)  # Raises ValueError if invalid
-
-        elif self.type == "Span":
-            if (
-                not isinstance(self.value, dict)
-                or "start" not in self.value
-                or "end" not in self.value
-            ):
-                raise ValueError("Span value must be a dict with 'start' and 'end'")
-            start = isodate.parse_datetime(self.value["start"])
-            end = isodate.parse_datetime(self.value["end"])
-            if start >= end:
-                raise ValueError("Span start must be before end")
-
-        elif self.type == "Series":
-            if not isinstance(self.value, list):
-                raise ValueError("Series value must be a list")
-            times = [isodate.parse_datetime(t) for t in self.value]
-            if not times:
-                raise ValueError("Series cannot be empty")
-            if times != sorted(times):
-                raise ValueError("Series timestamps must be sorted")
+        _check_time_value(self.type, self.value)
 
     def to_dict(self) -> dict:
         """
@@ -521,6 +903,7 @@ class MyrezeDataPackage:
         semantic_context: Semantic metadata for MCP/RAG integration
         multi_resolution_data: Multi-resolution data support
         agent_context: Multi-agent context with attribution and audit trails
+        auto_downcast_data: Whether to store float64 data arrays as float32
 
     Example:
         >>> import numpy as np
@@ -573,6 +956,7 @@ class MyrezeDataPackage:
         semantic_context: Optional[SemanticContext] = None,
         multi_resolution_data: Optional[MultiResolutionData] = None,
         agent_context: Optional["MultiAgentContext"] = None,
+        auto_downcast_data: bool = False,
     ):
         """
         Initialize an enhanced MyrezeDataPackage.
@@ -591,7 +975,12 @@ class MyrezeDataPackage:
             semantic_context: Semantic metadata for MCP/RAG integration
             multi_resolution_data: Multi-resolution data support
             agent_context: Multi-agent context with attribution
+            auto_downcast_data: If True, float64 arrays in ``data`` are stored
+                as float32, halving the memory every downstream pass touches
         """
+        if auto_downcast_data:
+            data = {key: _narrow_floats(value) for key, value in data.items()}
+
         # Core fields (backwards compatible)
         self.id = id
         self.data = data
@@ -632,6 +1021,12 @@ class MyrezeDataPackage:
         if validate_on_init:
             self._validate()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning any public field invalidates the cached LLM summary
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.__dict__.pop("_llm_summary_cache", None)
+
     def _generate_basic_semantic_context(self) -> SemanticContext:
         """Auto-generate basic semantic context from available data."""
         # Extract basic insights from data structure
@@ -677,8 +1072,13 @@ class MyrezeDataPackage:
 
         # Analyze point data if present
         if "locations" in self.data and "values" in self.data:
-            insights["num_points"] = len(self.data["locations"])
-            if self.data["values"]:
+            locations = self.data["locations"]
+            if isinstance(locations, dict):
+                # Struct-of-arrays form: count entries in a coordinate column
+                insights["num_points"] = len(locations.get("lat", []))
+            else:
+                insights["num_points"] = len(locations)
+            if len(self.data["values"]):
                 values = np.array(self.data["values"])
                 insights["value_range"] = [float(np.min(values)), float(np.max(values))]
                 insights["mean_value"] = float(np.mean(values))
@@ -692,6 +1092,7 @@ class MyrezeDataPackage:
         # Base description from visualization type
         type_descriptions = {
             "heatmap": "a heat map showing spatial distribution of values",
+            "heatmap_indexed": "a heat map showing spatial distribution of values",
             "flat_overlay": "a map overlay displaying spatial data",
             "point_cloud": "discrete data points at specific locations",
             "vector_field": "directional data showing flow or movement patterns",
@@ -900,21 +1301,69 @@ class MyrezeDataPackage:
 
         return colors
 
-    def to_dict(self, include_enhanced_features: bool = True) -> Dict[str, Any]:
+    def to_dict(
+        self,
+        include_enhanced_features: bool = True,
+        include_variants: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """
         Convert the data package to a JSON-serializable dictionary.
 
         Args:
             include_enhanced_features: Whether to include new LLM features
+            include_variants: Lazy multi-resolution variants to evaluate
+                and include (see ``MultiResolutionData.to_dict``)
 
         Returns:
             Dictionary representation suitable for JSON serialization
         """
+        return self._build_dict(
+            include_enhanced_features,
+            convert_arrays=True,
+            include_variants=include_variants,
+        )
+
+    def _build_dict(
+        self,
+        include_enhanced_features: bool,
+        convert_arrays: bool,
+        include_variants: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the package dictionary.
+
+        Args:
+            include_enhanced_features: Whether to include new LLM features
+            convert_arrays: Whether to convert NumPy arrays in ``data`` to
+                nested lists. Encoders that handle arrays natively pass False
+                to skip building the intermediate Python lists.
+            include_variants: Lazy multi-resolution variants to evaluate
+
+        Returns:
+            Dictionary representation of the package
+        """
+        package_dict = self._build_base_dict(convert_arrays)
+        if include_enhanced_features:
+            package_dict.update(self._build_enhanced_dict(include_variants))
+        return package_dict
+
+    def _build_base_dict(self, convert_arrays: bool) -> Dict[str, Any]:
+        """
+        Build the backwards compatible part of the package dictionary.
+
+        Args:
+            convert_arrays: Whether to convert NumPy arrays in ``data`` to
+                nested lists
+
+        Returns:
+            Dictionary with the core package fields
+        """
         # Convert NumPy arrays and bytes for JSON compatibility
         data = self.data.copy()
         for key, value in data.items():
             if isinstance(value, np.ndarray):
-                data[key] = value.tolist()
+                if convert_arrays:
+                    data[key] = value.tolist()
             elif isinstance(value, bytes):
                 data[key] = base64.b64encode(value).decode("utf-8")
             elif isinstance(value, list):
@@ -947,42 +1396,176 @@ class MyrezeDataPackage:
             "visualization_type": self.visualization_type,
         }
 
-        # Add enhanced features if requested
-        if include_enhanced_features:
-            package_dict.update(
-                {
-                    "visual_summary": (
-                        self.visual_summary.to_dict() if self.visual_summary else None
-                    ),
-                    "semantic_context": (
-                        self.semantic_context.to_dict()
-                        if self.semantic_context
-                        else None
-                    ),
-                    "multi_resolution_data": (
-                        self.multi_resolution_data.to_dict()
-                        if self.multi_resolution_data
-                        else None
-                    ),
-                    "agent_context": (
-                        self.agent_context.to_dict() if self.agent_context else None
-                    ),
-                }
-            )
-
         return package_dict
 
-    def to_json(self, include_enhanced_features: bool = True) -> str:
+    def _build_enhanced_dict(
+        self, include_variants: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the LLM/multimodal feature fields of the package dictionary.
+
+        Args:
+            include_variants: Lazy multi-resolution variants to evaluate
+
+        Returns:
+            Dictionary with the enhanced feature fields
+        """
+        return {
+            "visual_summary": (
+                self.visual_summary.to_dict() if self.visual_summary else None
+            ),
+            "semantic_context": (
+                self.semantic_context.to_dict() if self.semantic_context else None
+            ),
+            "multi_resolution_data": (
+                self.multi_resolution_data.to_dict(include_variants)
+                if self.multi_resolution_data
+                else None
+            ),
+            "agent_context": (
+                self.agent_context.to_dict() if self.agent_context else None
+            ),
+        }
+
+    def to_json(
+        self,
+        include_enhanced_features: bool = True,
+        include_variants: Optional[List[str]] = None,
+    ) -> str:
         """
         Convert the data package to a JSON string.
 
+        Uses ``orjson`` when it is installed, which serializes NumPy arrays
+        directly from their buffers instead of going through ``tolist()``.
+        Falls back to the standard library ``json`` module otherwise, which
+        converts each array only as the encoder reaches it. Packages with
+        NaN or infinite values always use the standard library, so these
+        are written as ``NaN``/``Infinity`` whichever encoder is installed.
+
         Args:
             include_enhanced_features: Whether to include new LLM features
+            include_variants: Lazy multi-resolution variants to evaluate
+                and include (see ``MultiResolutionData.to_dict``)
 
         Returns:
             JSON string representation of the package
         """
-        return json.dumps(self.to_dict(include_enhanced_features))
+        return _json_dumps(
+            self._build_dict(
+                include_enhanced_features,
+                convert_arrays=False,
+                include_variants=include_variants,
+            )
+        )
+
+    def to_json_views(
+        self, include_variants: Optional[List[str]] = None
+    ) -> Tuple[str, str]:
+        """
+        Convert the data package to legacy and full JSON strings at once.
+
+        The full document is the legacy document with the enhanced feature
+        fields appended, so the core fields (including the data arrays) are
+        encoded once and shared by both strings. Each string is identical to
+        the corresponding ``to_json`` output.
+
+        Args:
+            include_variants: Lazy multi-resolution variants to evaluate
+                and include in the full JSON
+
+        Returns:
+            Tuple of (legacy JSON, full JSON)
+
+        Example:
+            >>> legacy_json, full_json = package.to_json_views()
+        """
+        base_dict = self._build_base_dict(convert_arrays=False)
+        enhanced_dict = self._build_enhanced_dict(include_variants)
+        legacy_fast = orjson is not None and not _has_non_finite(base_dict)
+        full_fast = legacy_fast and not _has_non_finite(enhanced_dict)
+        legacy_json = _json_dumps(base_dict, legacy_fast)
+        if full_fast != legacy_fast:
+            # to_json would pick a different encoder for the full document
+            return legacy_json, _json_dumps({**base_dict, **enhanced_dict}, False)
+        enhanced_json = _json_dumps(enhanced_dict, full_fast)
+        full_json = legacy_json[:-1] + _JSON_ITEM_SEPARATOR + enhanced_json[1:]
+        return legacy_json, full_json
+
+    def to_compressed_json(self, include_enhanced_features: bool = True) -> str:
+        """
+        Convert the data package to a string-deduplicated JSON string.
+
+        Strings (keys and values) that occur more than once are stored once
+        in a table and replaced by short base62 references, in the style of
+        ``compress-json``. The result is a JSON array ``[strings, root]``.
+        This pays off for packages that repeat keys, tags and identifiers
+        across their semantic context and agent annotations.
+
+        Args:
+            include_enhanced_features: Whether to include new LLM features
+
+        Returns:
+            Compressed JSON string; decode with ``from_compressed_json``
+        """
+        package_dict = self.to_dict(include_enhanced_features)
+        counts: Dict[str, int] = {}
+        _count_strings(package_dict, counts)
+
+        # Only strings longer than their reference are worth a table entry
+        table = [
+            string
+            for string, count in counts.items()
+            if count > 1 and len(string) > len(_to_base62(len(counts))) + 1
+        ]
+        refs = {string: "|" + _to_base62(i) for i, string in enumerate(table)}
+        root = _dedupe_strings(package_dict, refs)
+        return json.dumps([table, root], default=_json_default, separators=(",", ":"))
+
+    def to_msgpack(self, include_enhanced_features: bool = True) -> bytes:
+        """
+        Convert the data package to msgpack bytes.
+
+        NumPy arrays are encoded as a single binary blob with their dtype
+        and shape rather than as lists of numbers, which makes the payload
+        several times smaller than JSON for array-heavy packages.
+
+        Args:
+            include_enhanced_features: Whether to include new LLM features
+
+        Returns:
+            msgpack-encoded bytes; decode with ``from_msgpack``
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for to_msgpack()")
+
+        package_dict = self._build_dict(include_enhanced_features, convert_arrays=False)
+        return msgpack.packb(package_dict, default=_msgpack_default, use_bin_type=True)
+
+    def to_pickle(self, buffers: Optional[List[pickle.PickleBuffer]] = None) -> bytes:
+        """
+        Serialize the data package with pickle protocol 5.
+
+        Unlike ``to_json`` this keeps NumPy arrays as arrays, so it is the
+        faster choice for passing packages between Python processes. If a
+        ``buffers`` list is given, array data is appended to it out-of-band
+        instead of being copied into the returned bytes.
+
+        Args:
+            buffers: Optional list that receives out-of-band array buffers
+
+        Returns:
+            Pickled bytes; pass the same buffers to ``from_pickle``
+
+        Example:
+            >>> buffers = []
+            >>> payload = package.to_pickle(buffers)
+            >>> restored = MyrezeDataPackage.from_pickle(payload, buffers)
+        """
+        buffer_callback = buffers.append if buffers is not None else None
+        return pickle.dumps(self, protocol=5, buffer_callback=buffer_callback)
 
     def to_threejs(self, params: Optional[Dict[str, Any]] = None) -> Any:
         """Generate Three.js visualization output."""
@@ -996,13 +1579,77 @@ class MyrezeDataPackage:
             raise ValueError("No Unreal renderer configured for this package")
         return self.unreal_visualization.render(self.data, params or {})
 
+    def _agent_context_version(self) -> Optional[tuple]:
+        """Cheap marker that changes whenever agent context is added."""
+        if not self.agent_context:
+            return None
+        return (
+            self.agent_context.last_modified,
+            sum(
+                len(chain.annotations)
+                for chain in self.agent_context.context_chains.values()
+            ),
+        )
+
+    def _cached_llm_summary(self) -> Dict[str, Any]:
+        """Return the cache entry for the LLM summary, rebuilding if stale."""
+        version = self._agent_context_version()
+        cache = self.__dict__.get("_llm_summary_cache")
+        if cache is None or cache["version"] != version:
+            cache = {"version": version, "summary": self._build_llm_summary()}
+            self._llm_summary_cache = cache
+        return cache
+
     def get_llm_summary(self) -> Dict[str, Any]:
         """
         Get comprehensive summary optimized for LLM consumption.
 
+        The summary is cached on the package. The cache is refreshed when a
+        field is reassigned or agent context is added. In-place edits to
+        nested objects such as ``metadata`` are not detected; reassign the
+        field to pick them up. Each call returns a shallow copy, so adding or
+        replacing its keys does not affect the cache.
+
         Returns:
             Dictionary with all information LLMs need to understand the package
         """
+        return dict(self._cached_llm_summary()["summary"])
+
+    def get_llm_summary_json(self) -> str:
+        """
+        Get the LLM summary as a JSON string, cached like ``get_llm_summary``.
+
+        Returns:
+            JSON string of ``get_llm_summary()``
+        """
+        cache = self._cached_llm_summary()
+        if "json" not in cache:
+            cache["json"] = json.dumps(cache["summary"], default=_json_default)
+        return cache["json"]
+
+    def get_llm_summary_key(self) -> str:
+        """
+        Get a content hash of the LLM summary, cached like ``get_llm_summary``.
+
+        Packages with the same summary share the same key across processes,
+        so it can key persistent caches of derived artifacts such as
+        embeddings of the natural description and semantic tags.
+
+        Returns:
+            Hex SHA-256 digest of ``get_llm_summary_json()``
+
+        Example:
+            >>> path = cache_dir / f"{package.get_llm_summary_key()}.npy"
+            >>> embedding = np.load(path) if path.exists() else embed(package)
+        """
+        cache = self._cached_llm_summary()
+        if "key" not in cache:
+            summary_json = self.get_llm_summary_json()
+            cache["key"] = hashlib.sha256(summary_json.encode("utf-8")).hexdigest()
+        return cache["key"]
+
+    def _build_llm_summary(self) -> Dict[str, Any]:
+        """Build the summary returned by ``get_llm_summary``."""
         summary = {
             "package_id": self.id,
             "visualization_type": self.visualization_type,
@@ -1040,7 +1687,58 @@ class MyrezeDataPackage:
     @classmethod
     def from_json(cls, json_str: str) -> "MyrezeDataPackage":
         """Create a data package from a JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json_loads(json_str))
+
+    @classmethod
+    def from_compressed_json(cls, json_str: str) -> "MyrezeDataPackage":
+        """Create a data package from a string produced by ``to_compressed_json``."""
+        # Decode with the stdlib, which wrote the string and may have written
+        # NaN/Infinity tokens
+        table, root = json.loads(json_str)
+        return cls.from_dict(_restore_strings(root, table))
+
+    @classmethod
+    def from_msgpack(cls, payload: bytes) -> "MyrezeDataPackage":
+        """
+        Create a data package from bytes produced by ``to_msgpack``.
+
+        Arrays are restored as read-only views of the payload.
+
+        Args:
+            payload: Bytes returned by ``to_msgpack``
+
+        Returns:
+            The restored data package
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required for from_msgpack()")
+        return cls.from_dict(
+            msgpack.unpackb(payload, object_hook=_msgpack_object_hook, raw=False)
+        )
+
+    @classmethod
+    def from_pickle(
+        cls, payload: bytes, buffers: Optional[List[pickle.PickleBuffer]] = None
+    ) -> "MyrezeDataPackage":
+        """
+        Create a data package from bytes produced by ``to_pickle``.
+
+        Only unpickle data from trusted sources.
+
+        Args:
+            payload: Bytes returned by ``to_pickle``
+            buffers: Out-of-band buffers collected by ``to_pickle``, if any
+
+        Returns:
+            The restored data package
+        """
+        package = pickle.loads(payload, buffers=buffers)
+        if not isinstance(package, cls):
+            raise ValueError(f"Pickled object is not a {cls.__name__}")
+        return package
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MyrezeDataPackage":
@@ -1142,6 +1840,47 @@ class MyrezeDataPackage:
             ...     annotation_type="statistical"
             ... )
         """
+        return self._ensure_agent_context().add_context(
+            content=content,
+            agent_id=agent_id,
+            context_type=context_type,
+            agent_type=agent_type,
+            annotation_type=annotation_type,
+            confidence=confidence,
+            metadata=metadata,
+        )
+
+    def add_agent_contexts(
+        self, contexts: List[Dict[str, Any]]
+    ) -> List["AgentAnnotation"]:
+        """
+        Add context from several agents in one call.
+
+        Cheaper than calling ``add_agent_context`` repeatedly: the batch
+        shares one timestamp and one modification of the agent context.
+
+        Args:
+            contexts: Keyword arguments for ``add_agent_context``, one dict
+                per annotation
+
+        Returns:
+            The created AgentAnnotations, in order
+
+        Raises:
+            TypeError: If a dict has keys ``add_agent_context`` does not take
+
+        Example:
+            >>> package.add_agent_contexts([
+            ...     {"content": "Record intensity", "agent_id": "weather_expert_v2",
+            ...      "context_type": "expert_opinion", "confidence": 0.95},
+            ...     {"content": "Variance is 2.3 sigma above normal",
+            ...      "agent_id": "statistical_analysis_agent"},
+            ... ])
+        """
+        return self._ensure_agent_context().add_contexts(contexts)
+
+    def _ensure_agent_context(self) -> "MultiAgentContext":
+        """Return the agent context, creating it on first use."""
         # Import here to avoid circular imports
         global MultiAgentContext
         if MultiAgentContext is None:
@@ -1151,15 +1890,7 @@ class MyrezeDataPackage:
         if self.agent_context is None:
             self.agent_context = MultiAgentContext(package_id=self.id)
 
-        return self.agent_context.add_context(
-            content=content,
-            agent_id=agent_id,
-            context_type=context_type,
-            agent_type=agent_type,
-            annotation_type=annotation_type,
-            confidence=confidence,
-            metadata=metadata,
-        )
+        return self.agent_context
 
     def get_agent_context_summary(self) -> Dict[str, Any]:
         """
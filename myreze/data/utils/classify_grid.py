@@ -0,0 +1,40 @@
+import numpy as np
+
+
+def classify_grid(grid, thresholds, levels=(1.0, 0.5, 0.25, 0.0)):
+    """
+    Band a grid into levels by descending thresholds, e.g. hot/warm/cool.
+
+    Cells at or above ``thresholds[0]`` get ``levels[0]``, cells at or above
+    ``thresholds[1]`` get ``levels[1]`` and so on; cells below the last
+    threshold get ``levels[-1]``. The whole grid is classified with one
+    ``np.digitize`` call and a table lookup instead of per-cell branching.
+
+    Args:
+        grid: NumPy array of values to classify
+        thresholds: Descending thresholds, e.g. ``(hot, warm, cool)``
+        levels: One more level than thresholds, highest band first
+
+    Returns:
+        float32 array of levels with the shape of ``grid``
+
+    Raises:
+        ValueError: If the thresholds are not descending or the number of
+            levels does not match
+
+    Example:
+        >>> bands = classify_grid(temp_grid, thresholds=(30.0, 25.0, 20.0))
+    """
+    if len(levels) != len(thresholds) + 1:
+        raise ValueError(
+            f"Expected {len(thresholds) + 1} levels for {len(thresholds)} "
+            f"thresholds, got {len(levels)}"
+        )
+
+    # np.digitize wants ascending bins, so flip thresholds and levels
+    bins = np.asarray(thresholds, dtype=np.float64)[::-1]
+    if np.any(np.diff(bins) <= 0):
+        raise ValueError("Thresholds must be strictly descending")
+    table = np.asarray(levels, dtype=np.float32)[::-1]
+
+    return table[np.digitize(grid, bins)]
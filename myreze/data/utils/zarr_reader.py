@@ -4,6 +4,51 @@ import os
 from rasterio.transform import from_origin
 
 
+def _bracket(index, size):
+    """
+    Return the neighbouring indices and blend weight for a fractional index.
+
+    Within the valid range the lower index is clamped so that it always has
+    an upper neighbour, which folds the integer and last-index edge cases into
+    the same arithmetic: an index on the last step blends fully towards it
+    with weight 1.
+
+    Returns:
+        tuple: (lower_index, upper_index, weight)
+
+    Raises:
+        IndexError: If the index lies outside ``[0, size - 1]``
+    """
+    if not 0 <= index <= size - 1:
+        raise IndexError(f"Index {index} is out of range for axis of size {size}")
+
+    lower = min(int(np.floor(index)), max(size - 2, 0))
+    upper = min(lower + 1, size - 1)
+    return lower, upper, float(index - lower)
+
+
+def _bilerp(tl, tr, bl, br, time_weight, level_weight):
+    """
+    Bilinear blend of four corner grids into a single output buffer.
+
+    Equivalent to interpolating along time and then along level, but the
+    four corner weights are folded into scalars up front so the grid is
+    touched with in-place multiply-adds instead of a chain of temporaries.
+    """
+    weights = (
+        (1 - time_weight) * (1 - level_weight),
+        time_weight * (1 - level_weight),
+        (1 - time_weight) * level_weight,
+        time_weight * level_weight,
+    )
+    out = np.multiply(tl, weights[0], dtype=np.result_type(tl.dtype, np.float32))
+    scratch = np.empty_like(out)
+    for corner, weight in zip((tr, bl, br), weights[1:]):
+        np.multiply(corner, weight, out=scratch)
+        out += scratch
+    return out
+
+
 class ZarrReader:
     """
     Class for managing input data from zarr files and extracting weather variables
@@ -15,6 +60,7 @@ class ZarrReader:
         self.weather_layer = None  # Variable name to extract (e.g., 'temperature')
         self.timestep = 0  # Can be float for interpolation (e.g., 10.5)
         self.level = 0  # Can be float for interpolation (e.g., 2.5)
+        self._layout = None  # (dataset, grid layout) cached by _grid_layout()
 
     def load_dataset(self, chunks=False):
         """
@@ -28,6 +74,57 @@ class ZarrReader:
             self.ds = self.ds.compute()
         return self.ds
 
+    def _grid_layout(self):
+        """
+        Return the lat/lon layout of the loaded dataset.
+
+        The layout only depends on the dataset coordinates, so it is computed
+        once per dataset and reused across extract_array() calls for other
+        variables, timesteps and levels.
+
+        Returns:
+            dict: flip_lat, split_index, cell_size and transform
+        """
+        if self._layout is not None and self._layout[0] is self.ds:
+            return self._layout[1]
+
+        lat_values = self.ds.lat.values
+        lon_values = self.ds.lon.values
+
+        # Check if latitudes need flipping (make sure north is up)
+        flip_lat = bool(lat_values[0] < lat_values[-1])
+
+        # Longitudes are stored ascending, so the first value >= 180 is a binary search
+        split_index = int(np.searchsorted(lon_values, 180.0, side='left'))
+        if split_index == len(lon_values):
+            split_index = None
+
+        # Calculate grid cell size from dataset, averaging if lat/lon differ
+        if len(lon_values) > 1 and len(lat_values) > 1:
+            lon_res = abs(float(lon_values[1] - lon_values[0]))
+            lat_res = abs(float(lat_values[1] - lat_values[0]))
+            cell_size = (lon_res + lat_res) / 2
+        else:
+            # Default cell size if we can't determine from dataset
+            cell_size = 0.25
+
+        # Define the geospatial transform
+        transform = from_origin(
+            west=-180.0,
+            north=90.0,
+            xsize=cell_size,
+            ysize=cell_size
+        )
+
+        layout = {
+            'flip_lat': flip_lat,
+            'split_index': split_index,
+            'cell_size': cell_size,
+            'transform': transform,
+        }
+        self._layout = (self.ds, layout)
+        return layout
+
     def extract_array(self):
         """
         Extract a numpy array from the zarr dataset for the specified weather layer,
@@ -50,17 +147,7 @@ class ZarrReader:
         level_idx = float(self.level) if has_level else None
 
         # Time interpolation indices
-        time_idx_floor = int(np.floor(time_idx))
-        time_idx_ceil = int(np.ceil(time_idx))
-
-        # Handle edge case for integer time index
-        if time_idx_floor == time_idx_ceil:
-            time_idx_ceil = time_idx_floor + 1
-            if time_idx_ceil >= len(self.ds.time):
-                time_idx_ceil = time_idx_floor
-                time_idx_floor = max(0, time_idx_floor - 1)
-
-        time_weight = (time_idx - time_idx_floor) / max(1, time_idx_ceil - time_idx_floor)
+        time_idx_floor, time_idx_ceil, time_weight = _bracket(time_idx, len(self.ds.time))
 
         # Common selection parameters (if dataset has these dimensions)
         select_params = {}
@@ -72,61 +159,44 @@ class ZarrReader:
         # Extract and interpolate data
         if has_level and level_idx is not None:
             # Level interpolation indices
-            level_idx_floor = int(np.floor(level_idx))
-            level_idx_ceil = int(np.ceil(level_idx))
+            level_idx_floor, level_idx_ceil, level_weight = _bracket(level_idx, len(self.ds.level))
 
-            # Handle edge case for integer level index
-            if level_idx_floor == level_idx_ceil:
-                level_idx_ceil = level_idx_floor + 1
-                if level_idx_ceil >= len(self.ds.level):
-                    level_idx_ceil = level_idx_floor
-                    level_idx_floor = max(0, level_idx_floor - 1)
-
-            level_weight = (level_idx - level_idx_floor) / max(1, level_idx_ceil - level_idx_floor)
-
-            # Get data for all four corners for bilinear interpolation
-            data_tl = self.ds[variable_name].isel(time=time_idx_floor, level=level_idx_floor, **select_params).values
-            data_tr = self.ds[variable_name].isel(time=time_idx_ceil, level=level_idx_floor, **select_params).values
-            data_bl = self.ds[variable_name].isel(time=time_idx_floor, level=level_idx_ceil, **select_params).values
-            data_br = self.ds[variable_name].isel(time=time_idx_ceil, level=level_idx_ceil, **select_params).values
+            # Read all four corners in one selection as a (time, level, lat, lon) block
+            block = self.ds[variable_name].isel(
+                time=[time_idx_floor, time_idx_ceil],
+                level=[level_idx_floor, level_idx_ceil],
+                **select_params
+            ).transpose('time', 'level', ...).values
 
             # Bilinear interpolation
-            top = (1 - time_weight) * data_tl + time_weight * data_tr
-            bottom = (1 - time_weight) * data_bl + time_weight * data_br
-            data_array = (1 - level_weight) * top + level_weight * bottom
+            data_array = _bilerp(block[0, 0], block[1, 0], block[0, 1], block[1, 1],
+                                 time_weight, level_weight)
         else:
             # Time interpolation only
-            data_floor = self.ds[variable_name].isel(time=time_idx_floor, **select_params).values
-            data_ceil = self.ds[variable_name].isel(time=time_idx_ceil, **select_params).values
-            data_array = (1 - time_weight) * data_floor + time_weight * data_ceil
-
-        # Check if latitudes need flipping (make sure north is up)
-        if self.ds.lat[0].item() < self.ds.lat[-1].item():
-            data_array = np.flipud(data_array)
-
-        # Handle longitude wrapping to ensure -180 to 180 range
-        lon_values = self.ds.lon.values
-        if np.any(lon_values >= 180):
-            split_index = np.where(lon_values >= 180)[0][0]
-            data_array = np.roll(data_array, -split_index, axis=1)
-
-        # Calculate grid cell size from dataset
-        if hasattr(self.ds, 'lon') and hasattr(self.ds, 'lat'):
-            lon_res = abs(float(self.ds.lon[1] - self.ds.lon[0]))
-            lat_res = abs(float(self.ds.lat[1] - self.ds.lat[0]))
-            # Use average resolution if they differ
-            cell_size = (lon_res + lat_res) / 2
-        else:
-            # Default cell size if we can't determine from dataset
-            cell_size = 0.25
-
-        # Define the geospatial transform
-        transform = from_origin(
-            west=-180.0,
-            north=90.0,
-            xsize=cell_size,
-            ysize=cell_size
-        )
+            block = self.ds[variable_name].isel(
+                time=[time_idx_floor, time_idx_ceil], **select_params
+            ).transpose('time', ...).values
+            data_array = (1 - time_weight) * block[0] + time_weight * block[1]
+
+        layout = self._grid_layout()
+
+        # Make sure north is up (a reversed view, copied at most once below)
+        rows = slice(None, None, -1) if layout['flip_lat'] else slice(None)
+
+        # Handle longitude wrapping to ensure -180 to 180 range by copying the
+        # two halves into place, which also materializes the latitude flip
+        split_index = layout['split_index']
+        if split_index is not None:
+            wrapped = np.empty_like(data_array)
+            east_width = data_array.shape[1] - split_index
+            wrapped[:, :east_width] = data_array[rows, split_index:]
+            wrapped[:, east_width:] = data_array[rows, :split_index]
+            data_array = wrapped
+        elif layout['flip_lat']:
+            data_array = np.ascontiguousarray(data_array[rows])
+
+        cell_size = layout['cell_size']
+        transform = layout['transform']
 
         # Define source CRS (WGS84)
         crs = '+proj=longlat +ellps=WGS84 +datum=WGS84 +no_defs'
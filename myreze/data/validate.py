@@ -6,11 +6,12 @@ schema definitions that LLM agents can use to understand expected data
 structures for different visualization types.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
 import numpy as np
 import isodate
 
-
 # Schema definitions for LLM agent discovery
 MDP_BASE_SCHEMA = {
     "type": "object",
@@ -66,13 +67,16 @@ VISUALIZATION_DATA_SCHEMAS = {
     "point_cloud": {
         "description": "Discrete data points like sensor readings, weather stations",
         "required_fields": ["locations", "values"],
-        "optional_fields": ["point_ids", "colors", "sizes", "timestamps"],
+        "optional_fields": ["point_ids", "colors", "sizes", "timestamps", "timestamp"],
         "field_specifications": {
             "locations": {
-                "type": "array of objects",
+                "type": "point locations",
                 "description": "Geographic locations of data points",
-                "format": "[{lat: float, lon: float, elevation?: float}, ...]",
-                "example": '[{"lat": 40.7, "lon": -74.0, "elevation": 10}]',
+                "format": (
+                    "{lat: [...], lon: [...], elevation?: [...]} or "
+                    "[{lat: float, lon: float, elevation?: float}, ...]"
+                ),
+                "example": '{"lat": [40.7, 40.8], "lon": [-74.0, -73.9]}',
             },
             "values": {
                 "type": "array",
@@ -85,6 +89,17 @@ VISUALIZATION_DATA_SCHEMAS = {
                 "description": "Unique identifiers for each point",
                 "example": '["sensor_001", "sensor_002"]',
             },
+            "timestamps": {
+                "type": "array",
+                "description": "Observation time of each point",
+                "format": "Array of ISO 8601 strings matching locations length",
+            },
+            "timestamp": {
+                "type": "string",
+                "description": "Observation time shared by all points",
+                "format": "ISO 8601 string, used instead of 'timestamps'",
+                "example": '"2023-07-15T14:30:00Z"',
+            },
         },
     },
     "heatmap": {
@@ -110,10 +125,39 @@ VISUALIZATION_DATA_SCHEMAS = {
             },
         },
     },
+    "heatmap_indexed": {
+        "description": "Heatmap quantized to a color palette for compact transfer",
+        "required_fields": ["indices", "palette", "bounds"],
+        "optional_fields": ["values_range", "opacity"],
+        "field_specifications": {
+            "indices": {
+                "type": "2D array",
+                "description": "Palette index of each cell",
+                "format": "uint8 array[height][width]",
+            },
+            "palette": {
+                "type": "palette",
+                "description": "RGBA color for each index",
+                "format": "uint8 array[n][4] with n <= 256",
+            },
+            "bounds": {
+                "type": "array",
+                "description": "Geographic bounding box",
+                "format": "[west, south, east, north] in degrees",
+            },
+            "values_range": {
+                "type": "array",
+                "description": "Data values mapped to the first and last index",
+                "format": "[min_value, max_value]",
+            },
+        },
+    },
     "vector_field": {
         "description": "Directional data like wind, ocean currents",
         "required_fields": ["grid_points", "u_component", "v_component"],
-        "optional_fields": ["magnitude", "arrow_scale", "color_by"],
+        "optional_fields": ["magnitude", "arrow_scale", "color_by", "field"],
+        # A packed "field" array may stand in for the separate components
+        "packed_fields": {"field": ["u_component", "v_component", "magnitude"]},
         "field_specifications": {
             "grid_points": {
                 "type": "object",
@@ -131,6 +175,11 @@ VISUALIZATION_DATA_SCHEMAS = {
                 "description": "North-south component of vectors",
                 "format": "2D array matching grid dimensions",
             },
+            "field": {
+                "type": "packed components",
+                "description": "u, v and magnitude stacked into one array",
+                "format": "float32 array[3][height][width] ordered u, v, magnitude",
+            },
         },
     },
 }
@@ -211,29 +260,177 @@ def validate_mdp(data: Dict[str, Any]) -> None:
     time_value = time_data.get("value")
 
     try:
-        if time_type == "Timestamp":
-            isodate.parse_datetime(time_value)
-        elif time_type == "Span":
-            if (
-                not isinstance(time_value, dict)
-                or "start" not in time_value
-                or "end" not in time_value
-            ):
-                raise ValueError("Span must have start and end")
-            start = isodate.parse_datetime(time_value["start"])
-            end = isodate.parse_datetime(time_value["end"])
-            if start >= end:
-                raise ValueError("Span start must be before end")
-        elif time_type == "Series":
-            if not isinstance(time_value, list) or len(time_value) == 0:
-                raise ValueError("Series must be non-empty list")
-            times = [isodate.parse_datetime(t) for t in time_value]
-            if times != sorted(times):
-                raise ValueError("Series timestamps must be sorted")
+        _check_time_value(time_type, time_value)
     except Exception as e:
         raise ValueError(f"Time validation failed: {e}")
 
 
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 datetime, reusing results for repeated strings.
+
+    Packages handed between agents are rebuilt from JSON with the same
+    timestamps each time, so time validation parses each string once.
+    """
+    return isodate.parse_datetime(value)
+
+
+def _check_time_value(time_type: str, value: Any) -> None:
+    """
+    Check a time value against its type.
+
+    Shared by ``Time`` and ``validate_mdp`` so both apply the same rules.
+    Unknown time types are left to the caller.
+
+    Raises:
+        ValueError: If the value is malformed, not ISO 8601, or out of order
+    """
+    if time_type == "Timestamp":
+        if not isinstance(value, str):
+            raise ValueError("Timestamp value must be a string")
+        _parse_datetime(value)  # Raises ValueError if invalid
+
+    elif time_type == "Span":
+        if not isinstance(value, dict) or "start" not in value or "end" not in value:
+            raise ValueError("Span value must be a dict with 'start' and 'end'")
+        start = _parse_datetime(value["start"])
+        end = _parse_datetime(value["end"])
+        if start >= end:
+            raise ValueError("Span start must be before end")
+
+    elif time_type == "Series":
+        if not isinstance(value, list):
+            raise ValueError("Series value must be a list")
+        times = [_parse_datetime(t) for t in value]
+        if not times:
+            raise ValueError("Series cannot be empty")
+        # One pass over adjacent pairs instead of sorting a copy
+        if any(later < earlier for earlier, later in zip(times, times[1:])):
+            raise ValueError("Series timestamps must be sorted")
+
+
+def _check_2d_array(field: str, value: Any) -> Optional[str]:
+    if isinstance(value, np.ndarray):
+        if len(value.shape) != 2:
+            return f"Field '{field}' must be 2D array"
+    elif isinstance(value, list):
+        if not all(isinstance(row, list) for row in value):
+            return f"Field '{field}' must be 2D nested list"
+    else:
+        return f"Field '{field}' must be 2D array or nested list"
+    return None
+
+
+def _check_array(field: str, value: Any) -> Optional[str]:
+    if not isinstance(value, (list, np.ndarray)):
+        return f"Field '{field}' must be an array"
+    return None
+
+
+def _check_packed_components(field: str, value: Any) -> Optional[str]:
+    if isinstance(value, np.ndarray):
+        if value.ndim != 3 or value.shape[0] != 3:
+            return f"Field '{field}' must have shape (3, height, width)"
+    elif not (isinstance(value, list) and len(value) == 3):
+        return f"Field '{field}' must be a (3, height, width) array"
+    return None
+
+
+def _check_palette(field: str, value: Any) -> Optional[str]:
+    error = f"Field '{field}' must be 1 to 256 RGBA colors, shape (n, 4)"
+    if isinstance(value, np.ndarray):
+        if value.ndim != 2 or value.shape[1] != 4 or not 0 < len(value) <= 256:
+            return error
+    elif not isinstance(value, list) or not 0 < len(value) <= 256:
+        return error
+    elif not all(isinstance(row, (list, tuple)) and len(row) == 4 for row in value):
+        return error
+    return None
+
+
+def _check_string(field: str, value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return f"Field '{field}' must be a string"
+    return None
+
+
+def _check_array_of_objects(field: str, value: Any) -> Optional[str]:
+    if not isinstance(value, list):
+        return f"Field '{field}' must be an array"
+    if not all(isinstance(item, dict) for item in value):
+        return f"Field '{field}' must be array of objects"
+    return None
+
+
+def _check_point_locations(field: str, value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        # Struct-of-arrays form: parallel coordinate arrays
+        if "lat" not in value or "lon" not in value:
+            return f"Field '{field}' must contain 'lat' and 'lon'"
+        if len({len(column) for column in value.values()}) > 1:
+            return f"Field '{field}' coordinate arrays must have equal length"
+    elif isinstance(value, list):
+        if not all(isinstance(item, dict) for item in value):
+            return f"Field '{field}' must be array of objects"
+    else:
+        return (
+            f"Field '{field}' must be a dict of coordinate arrays "
+            "or an array of objects"
+        )
+    return None
+
+
+# Check function for each field specification type. Types without an entry
+# (e.g. "object", "number") are documented for agents but not enforced.
+_FIELD_CHECKS: Dict[str, Callable[[str, Any], Optional[str]]] = {
+    "2D array": _check_2d_array,
+    "array": _check_array,
+    "packed components": _check_packed_components,
+    "palette": _check_palette,
+    "string": _check_string,
+    "array of objects": _check_array_of_objects,
+    "point locations": _check_point_locations,
+}
+
+
+def _compile_validator(
+    schema: Dict[str, Any],
+) -> Tuple[
+    Tuple[str, ...],
+    Tuple[Tuple[str, Callable[[str, Any], Optional[str]]], ...],
+    Tuple[Tuple[str, Tuple[str, ...]], ...],
+]:
+    """
+    Compile a visualization data schema into the checks it requires.
+
+    Args:
+        schema: Entry from VISUALIZATION_DATA_SCHEMAS
+
+    Returns:
+        Tuple of (required fields, (field, check function) pairs,
+        (packed field, covered fields) pairs)
+    """
+    required_fields = tuple(schema.get("required_fields", []))
+    field_checks = tuple(
+        (field, _FIELD_CHECKS[spec["type"]])
+        for field, spec in schema.get("field_specifications", {}).items()
+        if spec.get("type") in _FIELD_CHECKS
+    )
+    packed_fields = tuple(
+        (field, tuple(covered))
+        for field, covered in schema.get("packed_fields", {}).items()
+    )
+    return required_fields, field_checks, packed_fields
+
+
+# The data schemas are static, so each one is compiled once at import time
+# and every validation call reuses the resulting checks
+_VALIDATORS = {
+    viz_type: _compile_validator(schema)
+    for viz_type, schema in VISUALIZATION_DATA_SCHEMAS.items()
+}
+
+
 def validate_visualization_data(data: Dict[str, Any], viz_type: str) -> List[str]:
     """
     Validate data structure against visualization type requirements.
@@ -252,43 +449,32 @@ def validate_visualization_data(data: Dict[str, Any], viz_type: str) -> List[str
         ... else:
         ...     print("Data structure is valid for heatmap visualization")
     """
-    if viz_type not in VISUALIZATION_DATA_SCHEMAS:
+    validator = _VALIDATORS.get(viz_type)
+    if validator is None:
         return [f"Unknown visualization type: {viz_type}"]
 
-    schema = VISUALIZATION_DATA_SCHEMAS[viz_type]
+    required_fields, field_checks, packed_fields = validator
     errors = []
 
+    # Fields supplied through a packed array count as present
+    covered = {
+        field for packed, fields in packed_fields if packed in data for field in fields
+    }
+
     # Check required fields
-    required_fields = schema.get("required_fields", [])
     for field in required_fields:
-        if field not in data:
+        if field not in data and field not in covered:
             errors.append(f"Required field '{field}' missing for {viz_type}")
 
     # Validate specific field formats
-    field_specs = schema.get("field_specifications", {})
-    for field, spec in field_specs.items():
+    for field, check in field_checks:
         if field in data:
-            value = data[field]
-            field_type = spec.get("type")
-
-            if field_type == "2D array":
-                if isinstance(value, np.ndarray):
-                    if len(value.shape) != 2:
-                        errors.append(f"Field '{field}' must be 2D array")
-                elif isinstance(value, list):
-                    if not all(isinstance(row, list) for row in value):
-                        errors.append(f"Field '{field}' must be 2D nested list")
-                else:
-                    errors.append(f"Field '{field}' must be 2D array or nested list")
-
-            elif field_type == "array" and not isinstance(value, list):
-                errors.append(f"Field '{field}' must be an array")
+            error = check(field, data[field])
+            if error:
+                errors.append(error)
 
-            elif field_type == "array of objects":
-                if not isinstance(value, list):
-                    errors.append(f"Field '{field}' must be an array")
-                elif not all(isinstance(item, dict) for item in value):
-                    errors.append(f"Field '{field}' must be array of objects")
+    if "timestamp" in data and "timestamps" in data:
+        errors.append("Use either 'timestamp' or 'timestamps', not both")
 
     return errors
 
@@ -356,12 +542,18 @@ def suggest_visualization_type(data: Dict[str, Any]) -> List[str]:
         suggestions.append("point_cloud")
 
     # Check for vector data
-    if all(field in data for field in ["grid_points", "u_component", "v_component"]):
+    if "grid_points" in data and (
+        "field" in data
+        or all(field in data for field in ["u_component", "v_component"])
+    ):
         suggestions.append("vector_field")
 
     # Check for trajectory data
-    if "positions" in data and isinstance(data.get("positions"), list):
-        if len(data["positions"]) > 1:
-            suggestions.append("trajectory")
+    positions = data.get("positions")
+    if isinstance(positions, dict):
+        # Struct-of-arrays form: one array per attribute
+        positions = positions.get("lat", [])
+    if isinstance(positions, list) and len(positions) > 1:
+        suggestions.append("trajectory")
 
     return suggestions
@@ -152,7 +152,7 @@ class MyrezeAgentHelper:
                 "colormap": "viridis|plasma|coolwarm|...",
             },
             "point_cloud": {
-                "locations": '[{"lat": float, "lon": float, "elevation": float}, ...]',
+                "locations": '{"lat": [...], "lon": [...], "elevation": [...]}',
                 "values": "[measurement1, measurement2, ...]",
                 "point_ids": '["id1", "id2", ...]',
             },
@@ -163,7 +163,7 @@ class MyrezeAgentHelper:
                 "magnitude": "[[speed_values, ...], ...]",
             },
             "trajectory": {
-                "positions": '[{"lat": float, "lon": float, "timestamp": "ISO8601"}, ...]',
+                "positions": '{"lat": [...], "lon": [...], "timestamp": ["ISO8601", ...]}',
                 "values": "[measurement_at_each_position, ...]",
                 "track_id": "unique_identifier",
             },
@@ -256,7 +256,12 @@ class MyrezeAgentHelper:
                 )
 
             if "locations" in data and "values" in data:
-                if len(data.get("locations", [])) != len(data.get("values", [])):
+                locations = data["locations"]
+                if isinstance(locations, dict):
+                    num_locations = len(locations.get("lat", []))
+                else:
+                    num_locations = len(locations)
+                if num_locations != len(data["values"]):
                     analysis["recommendations"].append(
                         "Ensure locations and values arrays have same length"
                     )
@@ -1,11 +1,17 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request, Response
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from myreze.store.product import Product
 from myreze.store.provider import ProductProvider
 from myreze.data import MyrezeDataPackage, Geometry, Time
+import json
 import uuid
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class OrderRequest(BaseModel):
     product_id: str
@@ -17,22 +23,69 @@ class OrderRequest(BaseModel):
 class StoreServer:
     """A FastAPI-based store server for MyrezeDataPackages."""
 
-    def __init__(self, provider: ProductProvider):
+    def __init__(self, provider: ProductProvider, cache_products: bool = False):
+        """
+        Initialize the store server.
+
+        Args:
+            provider: Provider whose products are listed and ordered
+            cache_products: If True, the provider's catalogue is fetched and
+                serialized once and reused by both /products and /orders.
+                Only use this for static catalogues, or call
+                ``refresh_products`` whenever the catalogue changes.
+        """
         self.app = FastAPI(title="Myreze Store")
         self.provider = provider
+        self.cache_products = cache_products
+        self._products: Optional[List[Product]] = None
+        self._products_json_bytes: Optional[bytes] = None
         self._register_endpoints()
 
+    def refresh_products(self) -> None:
+        """Drop the cached catalogue so the next request fetches it again."""
+        self._products = None
+        self._products_json_bytes = None
+
+    async def _get_products(self) -> List[Product]:
+        """Return the provider's products, cached if ``cache_products``."""
+        if self._products is not None:
+            return self._products
+        products = await self.provider.get_products()
+        if self.cache_products:
+            self._products = products
+        return products
+
+    async def _get_products_json(self) -> bytes:
+        """Return the serialized product listing, cached if ``cache_products``."""
+        if self._products_json_bytes is not None:
+            return self._products_json_bytes
+        products = [p.to_dict() for p in await self._get_products()]
+        if orjson is not None:
+            products_json = orjson.dumps(products)
+        else:
+            products_json = json.dumps(products).encode("utf-8")
+        if self.cache_products:
+            self._products_json_bytes = products_json
+        return products_json
+
     def _register_endpoints(self):
         @self.app.get("/products")
         async def list_products():
             """List available products."""
-            products = await self.provider.get_products()
-            return [p.to_dict() for p in products]
+            return Response(
+                await self._get_products_json(), media_type="application/json"
+            )
 
         @self.app.post("/orders")
-        async def create_order(request: OrderRequest):
-            """Create an order for a MyrezeDataPackage."""
-            products = await self.provider.get_products()
+        async def create_order(request: OrderRequest, http_request: Request):
+            """
+            Create an order for a MyrezeDataPackage.
+
+            Clients that send ``Accept: application/msgpack`` receive the
+            package as msgpack, with arrays as binary blobs. Everyone else,
+            or any request when msgpack is not installed, receives JSON.
+            """
+            products = await self._get_products()
             product = next(
                 (p for p in products if p.product_id == request.product_id), None
             )
@@ -49,6 +102,13 @@ class StoreServer:
             package = await product.generate_package(
                 request.spatial_region, request.temporal_region, request.visualization
             )
+            if "application/msgpack" in http_request.headers.get("accept", ""):
+                try:
+                    return Response(
+                        package.to_msgpack(), media_type="application/msgpack"
+                    )
+                except ImportError:
+                    pass  # Fall back to JSON
             return package.to_dict()
 
     def run(self, host: str = "0.0.0.0", port: int = 8000):
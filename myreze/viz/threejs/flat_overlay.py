@@ -4,6 +4,12 @@ from typing import Dict, Any, Optional
 import numpy as np
 import trimesh
 
+# Unit plane in the x-z plane shared by the overlay renderers
+_PLANE_VERTICES = np.array([[0, 0, 0], [1, 0, 0], [0, 0, 1], [1, 0, 1]])
+_PLANE_FACES = np.array([[2, 1, 0], [3, 1, 2]])
+_PLANE_VERTICES.setflags(write=False)
+_PLANE_FACES.setflags(write=False)
+
 
 @ThreeJSRenderer.register
 class FlatOverlayRenderer(ThreeJSRenderer):
@@ -17,10 +23,7 @@ class FlatOverlayRenderer(ThreeJSRenderer):
         texture = np.array(data)
 
         # Create a 2d horizontal GLB plane with alpha channel texture
-        plane = trimesh.Trimesh(
-            vertices=np.array([[0, 0, 0], [1, 0, 0], [0, 0, 1], [1, 0, 1]]),
-            faces=np.array([[2, 1, 0], [3, 1, 2]]),
-        )
+        plane = trimesh.Trimesh(vertices=_PLANE_VERTICES, faces=_PLANE_FACES)
         plane = attach_texture_to_mesh(plane, texture)
 
         return texture  # plane.export(file_type="glb")
@@ -61,10 +64,7 @@ class DummyRenderer(ThreeJSRenderer):
         texture = np.random.uniform(0, 1, (256, 256)).astype(np.float32)
 
         # Create a 2d horizontal GLB plane with alpha channel texture
-        plane = trimesh.Trimesh(
-            vertices=np.array([[0, 0, 0], [1, 0, 0], [0, 0, 1], [1, 0, 1]]),
-            faces=np.array([[2, 1, 0], [3, 1, 2]]),
-        )
+        plane = trimesh.Trimesh(vertices=_PLANE_VERTICES, faces=_PLANE_FACES)
         plane = attach_texture_to_mesh(plane, texture)
 
         return texture  # plane.export(file_type="glb")
@@ -1,9 +1,11 @@
-from PIL import Image
 import numpy as np
 import trimesh
 
 
 def attach_texture_to_mesh(mesh, texture_image):
+    # Imported lazily so that importing the renderers does not load PIL
+    from PIL import Image
+
     # Use x and z coordinates for UV mapping (since terrain is in the x-z plane)
     # This matches how 3D terrain is typically oriented in 3D space
     uv_coordinates = mesh.vertices[:, [0, 2]]  # FIXED: Use x,y for UV mapping
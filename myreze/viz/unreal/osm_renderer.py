@@ -11,6 +11,12 @@ class OSMRenderer(UnrealRenderer):
         """Render the data package as a Unreal Engine object."""
 
         rgba = data.get("grid")
-        rgba_uint8 = (rgba * 255).astype(np.uint8)
+
+        # Scale, clamp and round in one float buffer, then round straight
+        # into the uint8 output instead of truncating through astype
+        scaled = np.multiply(rgba, 255.0)
+        np.clip(scaled, 0, 255, out=scaled)
+        rgba_uint8 = np.empty(scaled.shape, dtype=np.uint8)
+        np.rint(scaled, out=rgba_uint8, casting="unsafe")
 
         return rgba_uint8
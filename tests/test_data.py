@@ -3,8 +3,26 @@
 Tests for data package functionality.
 """
 
+import json
+import sys
 import unittest
-from myreze.data import MyrezeDataPackage, Geometry
+import numpy as np
+from myreze.data import (
+    MyrezeDataPackage,
+    Geometry,
+    Time,
+    MultiResolutionData,
+    QuantizedArray,
+    SemanticContext,
+    match_semantic_categories,
+)
+from myreze.data.utils.classify_grid import classify_grid
+from myreze.data.validate import validate_mdp, validate_visualization_data
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 
 class TestDataPackage(unittest.TestCase):
@@ -19,5 +37,399 @@ class TestDataPackage(unittest.TestCase):
         self.assertIsInstance(geometry, Geometry)
 
 
+class TestSerialization(unittest.TestCase):
+    def _package(self):
+        data = {
+            "grid": np.arange(12.0).reshape(3, 4)[:, ::2],
+            "values": np.arange(3, dtype=np.int16),
+            "scale": np.float32(0.5),
+            "bounds": [-74.0, 40.7, -73.9, 40.8],
+        }
+        return MyrezeDataPackage(
+            id="serialization-test",
+            data=data,
+            time=Time.timestamp("2023-01-01T12:00:00Z"),
+        )
+
+    def test_to_json_arrays(self):
+        """Test NumPy arrays and scalars serialize as plain JSON values."""
+        package = self._package()
+        restored = json.loads(package.to_json())
+        self.assertEqual(
+            restored["data"]["grid"], [[0.0, 2.0], [4.0, 6.0], [8.0, 10.0]]
+        )
+        self.assertEqual(restored["data"]["values"], [0, 1, 2])
+        self.assertEqual(restored["data"]["scale"], 0.5)
+
+    def test_auto_downcast_data(self):
+        """Test float64 arrays are stored as float32 when downcasting."""
+        data = {"grid": np.arange(4.0), "values": np.arange(3, dtype=np.int16)}
+        package = MyrezeDataPackage(
+            id="downcast-test",
+            data=data,
+            time=Time.timestamp("2023-01-01T12:00:00Z"),
+            auto_downcast_data=True,
+        )
+        self.assertEqual(package.data["grid"].dtype, np.float32)
+        self.assertIs(package.data["values"], data["values"])
+        self.assertEqual(data["grid"].dtype, np.float64)
+
+    def test_json_round_trip(self):
+        """Test a package survives a JSON round trip."""
+        package = self._package()
+        restored = MyrezeDataPackage.from_json(package.to_json())
+        self.assertEqual(restored.id, package.id)
+        self.assertEqual(restored.data["bounds"], package.data["bounds"])
+
+    def test_from_json_non_finite(self):
+        """Test JSON with NaN and Infinity tokens loads."""
+        package = self._package()
+        package.data = {"grid": np.array([[1.0, np.nan], [np.inf, 2.0]])}
+        for json_str in (json.dumps(package.to_dict()), package.to_json()):
+            restored = MyrezeDataPackage.from_json(json_str)
+            np.testing.assert_array_equal(restored.data["grid"], package.data["grid"])
+
+    def test_to_json_views(self):
+        """Test both views match the corresponding to_json output."""
+        package = self._package()
+        package.semantic_context = SemanticContext(natural_description="test")
+        legacy_json, full_json = package.to_json_views()
+        self.assertEqual(legacy_json, package.to_json(include_enhanced_features=False))
+        self.assertEqual(full_json, package.to_json())
+
+    def test_to_json_non_finite(self):
+        """Test NaN and infinity are written as tokens, not null."""
+        package = self._package()
+        package.data["grid"] = np.array([[1.0, np.nan], [np.inf, 2.0]])
+        restored = json.loads(package.to_json())
+        grid = np.asarray(restored["data"]["grid"])
+        self.assertEqual(grid.dtype, np.float64)
+        self.assertTrue(np.isnan(grid[0, 1]))
+        self.assertEqual(grid[1, 0], np.inf)
+
+    def test_to_json_views_non_finite(self):
+        """Test the views match to_json when only one half has NaN."""
+        package = self._package()
+        package.semantic_context = SemanticContext(natural_description="test")
+        package.multi_resolution_data = MultiResolutionData(
+            full_resolution={"grid": np.array([[1.0, np.nan]])}
+        )
+        legacy_json, full_json = package.to_json_views()
+        self.assertEqual(legacy_json, package.to_json(include_enhanced_features=False))
+        self.assertEqual(full_json, package.to_json())
+
+    def test_to_json_non_string_keys(self):
+        """Test integer keys are written as strings, as the json module does."""
+        package = self._package()
+        package.metadata = {2023: "year"}
+        restored = MyrezeDataPackage.from_json(package.to_json())
+        self.assertEqual(restored.metadata, {"2023": "year"})
+
+    def test_compressed_json_round_trip(self):
+        """Test repeated strings are shared and restored exactly."""
+        package = self._package()
+        package.metadata = {
+            "tags": ["urban heat island"] * 3,
+            "pipe": "|literal",
+            "refs": {"|0": "urban heat island"},
+        }
+        compressed = package.to_compressed_json()
+        table, _ = json.loads(compressed)
+        self.assertIn("urban heat island", table)
+
+        restored = MyrezeDataPackage.from_compressed_json(compressed)
+        self.assertEqual(restored.metadata, package.metadata)
+        self.assertEqual(restored.to_json(), package.to_json())
+
+    def test_compressed_json_non_finite(self):
+        """Test NaN and infinity survive a compressed JSON round trip."""
+        package = self._package()
+        package.data["grid"] = np.array([[1.0, np.nan], [np.inf, 2.0]])
+        restored = MyrezeDataPackage.from_compressed_json(package.to_compressed_json())
+        np.testing.assert_array_equal(restored.data["grid"], package.data["grid"])
+
+    def test_multi_resolution_arrays(self):
+        """Test multi-resolution grids round trip as float32 arrays."""
+        grid = np.linspace(0.0, 1.0, 12).reshape(3, 4)
+        multi_resolution = MultiResolutionData(
+            full_resolution={"grid": grid, "purpose": "detailed_analysis"},
+            processed_variants={"anomaly": {"grid": grid - grid.mean()}},
+        )
+        encoded = json.loads(json.dumps(multi_resolution.to_dict()))
+        restored = MultiResolutionData.from_dict(encoded)
+
+        full = restored.full_resolution["grid"]
+        self.assertEqual(full.dtype, np.float32)
+        np.testing.assert_allclose(full, grid, rtol=1e-6)
+        self.assertEqual(restored.full_resolution["purpose"], "detailed_analysis")
+        self.assertEqual(restored.processed_variants["anomaly"]["grid"].shape, (3, 4))
+
+    def test_multi_resolution_float16(self):
+        """Test float16 grids are not widened when serialized."""
+        grid = np.linspace(0.0, 200.0, 12, dtype=np.float16).reshape(3, 4)
+        multi_resolution = MultiResolutionData(reduced_resolution={"grid": grid})
+        restored = MultiResolutionData.from_dict(multi_resolution.to_dict())
+        self.assertEqual(restored.reduced_resolution["grid"].dtype, np.float16)
+        np.testing.assert_array_equal(restored.reduced_resolution["grid"], grid)
+
+    def test_multi_resolution_lazy_variants(self):
+        """Test lazy variants are computed once and only when requested."""
+        calls = []
+
+        def anomaly():
+            calls.append(1)
+            return np.zeros((2, 2))
+
+        multi_resolution = MultiResolutionData(
+            processed_variants={"anomaly": {"grid": anomaly, "description": "d"}}
+        )
+        self.assertEqual(
+            multi_resolution.to_dict()["processed_variants"],
+            {"anomaly": {"description": "d"}},
+        )
+        self.assertEqual(calls, [])
+
+        encoded = multi_resolution.to_dict(include_variants=["anomaly"])
+        self.assertIn("grid", encoded["processed_variants"]["anomaly"])
+        multi_resolution.get_variant("anomaly")
+        self.assertEqual(calls, [1])
+
+    def test_multi_resolution_pickle_skips_lazy_variants(self):
+        """Test unevaluated lazy variants are left out when pickling."""
+        package = self._package()
+        package.multi_resolution_data = MultiResolutionData(
+            processed_variants={
+                "anomaly": {"grid": lambda: np.zeros(2), "description": "d"}
+            }
+        )
+        restored = MyrezeDataPackage.from_pickle(package.to_pickle())
+        self.assertEqual(
+            restored.multi_resolution_data.processed_variants,
+            {"anomaly": {"description": "d"}},
+        )
+
+    def test_multi_resolution_quantized(self):
+        """Test quantized grids keep their integer dtype and dequantize."""
+        grid = np.linspace(15.0, 30.0, 12).reshape(3, 4)
+        multi_resolution = MultiResolutionData(
+            reduced_resolution={"grid": QuantizedArray.from_array(grid, np.int16, 0.1)}
+        )
+        encoded = json.loads(json.dumps(multi_resolution.to_dict()))
+        self.assertEqual(encoded["reduced_resolution"]["grid"]["scale"], 0.1)
+
+        restored = MultiResolutionData.from_dict(encoded)
+        quantized = restored.reduced_resolution["grid"]
+        self.assertIsInstance(quantized, QuantizedArray)
+        self.assertEqual(quantized.values.dtype, np.int16)
+        np.testing.assert_allclose(quantized.dequantize(), grid, atol=0.05)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_round_trip(self):
+        """Test arrays keep their dtype and shape through msgpack."""
+        package = self._package()
+        restored = MyrezeDataPackage.from_msgpack(package.to_msgpack())
+        np.testing.assert_array_equal(restored.data["grid"], package.data["grid"])
+        self.assertEqual(restored.data["values"].dtype, np.int16)
+        self.assertEqual(restored.data["scale"], 0.5)
+
+    def test_pickle_round_trip(self):
+        """Test a package survives a pickle round trip with out-of-band buffers."""
+        package = self._package()
+        buffers = []
+        restored = MyrezeDataPackage.from_pickle(package.to_pickle(buffers), buffers)
+        self.assertTrue(buffers)
+        np.testing.assert_array_equal(restored.data["grid"], package.data["grid"])
+        self.assertEqual(restored.data["values"].dtype, np.int16)
+
+
+class TestLLMSummary(unittest.TestCase):
+    def test_summary_cache_invalidation(self):
+        """Test the cached summary refreshes on reassignment and new context."""
+        package = MyrezeDataPackage(
+            id="summary-test",
+            data={"values": [1.0]},
+            time=Time.timestamp("2023-01-01T12:00:00Z"),
+        )
+        summary = package.get_llm_summary()
+        summary["package_id"] = "changed"
+        self.assertEqual(package.get_llm_summary()["package_id"], "summary-test")
+        self.assertIs(package.get_llm_summary_json(), package.get_llm_summary_json())
+
+        package.metadata = {"source": "model"}
+        self.assertEqual(package.get_llm_summary()["metadata"], {"source": "model"})
+
+        package.add_agent_context("Looks plausible", agent_id="reviewer")
+        self.assertIn("agent_context", package.get_llm_summary())
+        self.assertEqual(
+            json.loads(package.get_llm_summary_json())["package_id"], "summary-test"
+        )
+
+    def test_summary_key(self):
+        """Test the summary key depends only on the summary contents."""
+        packages = [
+            MyrezeDataPackage(
+                id="summary-test",
+                data={"values": [1.0]},
+                time=Time.timestamp("2023-01-01T12:00:00Z"),
+            )
+            for _ in range(2)
+        ]
+        key = packages[0].get_llm_summary_key()
+        self.assertEqual(packages[1].get_llm_summary_key(), key)
+
+        packages[1].metadata = {"source": "model"}
+        self.assertNotEqual(packages[1].get_llm_summary_key(), key)
+
+    def test_add_agent_contexts(self):
+        """Test a batch of contexts lands in the right chains with one timestamp."""
+        package = MyrezeDataPackage(
+            id="context-test",
+            data={"values": [1.0]},
+            time=Time.timestamp("2023-01-01T12:00:00Z"),
+        )
+        summary = package.get_llm_summary()
+        annotations = package.add_agent_contexts(
+            [
+                {
+                    "content": "a",
+                    "agent_id": "expert",
+                    "context_type": "expert_opinion",
+                },
+                {"content": "b", "agent_id": "stats", "confidence": 0.9},
+            ]
+        )
+        self.assertEqual([a.content for a in annotations], ["a", "b"])
+        self.assertEqual(annotations[0].timestamp, annotations[1].timestamp)
+        self.assertEqual(
+            sorted(package.agent_context.context_chains), ["analysis", "expert_opinion"]
+        )
+        self.assertNotIn("agent_context", summary)
+        self.assertIn("agent_context", package.get_llm_summary())
+
+        with self.assertRaises(TypeError):
+            package.add_agent_contexts(
+                [{"content": "c", "agent_id": "stats", "references": ["a"]}]
+            )
+        self.assertEqual(package.get_agent_context_summary()["total_annotations"], 2)
+
+
+class TestTime(unittest.TestCase):
+    def test_series_order(self):
+        """Test series must be non-decreasing, with repeats allowed."""
+        Time.series(["2023-01-01T00:00:00Z"] * 2 + ["2023-01-01T01:00:00Z"])
+        with self.assertRaises(ValueError):
+            Time.series(["2023-01-01T01:00:00Z", "2023-01-01T00:00:00Z"])
+
+    def test_validate_mdp_series_order(self):
+        """Test validate_mdp applies the same series ordering rule as Time."""
+        package_dict = MyrezeDataPackage(
+            id="series-test",
+            data={},
+            time=Time.series(["2023-01-01T00:00:00Z"] * 2),
+        ).to_dict()
+        validate_mdp(package_dict)
+
+        package_dict["time"]["value"] = ["2023-01-01T01:00:00Z", "2023-01-01T00:00:00Z"]
+        with self.assertRaises(ValueError):
+            validate_mdp(package_dict)
+
+    def test_round_trip_revalidates(self):
+        """Test rebuilt times are still validated after cached parses."""
+        time = Time.span("2023-01-01T00:00:00Z", "2023-01-02T00:00:00Z")
+        self.assertEqual(Time.from_dict(time.to_dict()).value, time.value)
+        with self.assertRaises(ValueError):
+            Time.from_dict({"type": "Timestamp", "value": "not-a-time"})
+        with self.assertRaises(ValueError):
+            Time.from_dict(
+                {
+                    "type": "Span",
+                    "value": {"start": time.value["end"], "end": time.value["start"]},
+                }
+            )
+
+
+class TestSemanticCategories(unittest.TestCase):
+    def test_match_semantic_categories(self):
+        """Test tags match the categories they are substrings of, in order."""
+        self.assertEqual(
+            match_semantic_categories(["urban", "ocean", "heat_island", "weather"]),
+            ["weather", "oceanic", "urban"],
+        )
+
+    def test_semantic_tags_interned(self):
+        """Test tags are interned and deduplicated in their original order."""
+        tag = "".join(["heat", "_island"])
+        context = SemanticContext(semantic_tags=[tag, "urban", tag])
+        self.assertEqual(context.semantic_tags, ["heat_island", "urban"])
+        self.assertIs(context.semantic_tags[0], sys.intern("heat_island"))
+
+
+class TestValidation(unittest.TestCase):
+    def test_point_cloud_locations(self):
+        """Test both point_cloud location layouts validate."""
+        soa = {"locations": {"lat": [40.7, 40.8], "lon": [-74.0, -73.9]}}
+        aos = {"locations": [{"lat": 40.7, "lon": -74.0}]}
+        for locations in (soa, aos):
+            data = dict(locations, values=[1.0])
+            self.assertEqual(validate_visualization_data(data, "point_cloud"), [])
+
+        ragged = {"locations": {"lat": [40.7], "lon": [-74.0, -73.9]}, "values": []}
+        self.assertTrue(validate_visualization_data(ragged, "point_cloud"))
+
+    def test_point_cloud_timestamp(self):
+        """Test a shared timestamp is accepted in place of per-point ones."""
+        data = {
+            "locations": {"lat": [40.7, 40.8], "lon": [-74.0, -73.9]},
+            "values": [1.0, 2.0],
+            "timestamp": "2023-07-15T14:30:00Z",
+        }
+        self.assertEqual(validate_visualization_data(data, "point_cloud"), [])
+
+        data["timestamps"] = ["2023-07-15T14:30:00Z"] * 2
+        self.assertTrue(validate_visualization_data(data, "point_cloud"))
+
+    def test_vector_field_packed(self):
+        """Test a packed (3, H, W) field replaces the separate components."""
+        grid_points = {"lats": [40.0, 40.1], "lons": [-74.0, -73.9, -73.8]}
+        data = {
+            "grid_points": grid_points,
+            "field": np.zeros((3, 2, 3), dtype=np.float32),
+        }
+        self.assertEqual(validate_visualization_data(data, "vector_field"), [])
+
+        data["field"] = np.zeros((2, 2, 3), dtype=np.float32)
+        self.assertTrue(validate_visualization_data(data, "vector_field"))
+
+    def test_heatmap_indexed(self):
+        """Test palette-indexed heatmaps validate their palette shape."""
+        data = {
+            "indices": np.zeros((4, 4), dtype=np.uint8),
+            "palette": np.zeros((256, 4), dtype=np.uint8),
+            "bounds": [-74.0, 40.7, -73.9, 40.8],
+        }
+        self.assertEqual(validate_visualization_data(data, "heatmap_indexed"), [])
+
+        data["palette"] = np.zeros((256, 3), dtype=np.uint8)
+        self.assertTrue(validate_visualization_data(data, "heatmap_indexed"))
+
+        data["palette"] = [[0, 0, 0, 255], [1, 2, 3, 255]]
+        self.assertEqual(validate_visualization_data(data, "heatmap_indexed"), [])
+
+        data["palette"] = [[0, 0, 0, 255], [1, 2, 3]]
+        self.assertTrue(validate_visualization_data(data, "heatmap_indexed"))
+
+
+class TestClassifyGrid(unittest.TestCase):
+    def test_classify_grid(self):
+        """Test cells fall into the band of the highest threshold they reach."""
+        grid = np.array([[35.0, 30.0, 27.0], [25.0, 21.0, 10.0]])
+        bands = classify_grid(grid, thresholds=(30.0, 25.0, 20.0))
+        np.testing.assert_array_equal(bands, [[1.0, 1.0, 0.5], [0.5, 0.25, 0.0]])
+        self.assertEqual(bands.dtype, np.float32)
+
+        with self.assertRaises(ValueError):
+            classify_grid(grid, thresholds=(20.0, 25.0, 30.0))
+
+
 if __name__ == "__main__":
     unittest.main()